@@ -1,62 +1,137 @@
 """Apathetic schema package."""
 
-from typing import TYPE_CHECKING, cast
+import os
+from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
-    from .namespace import apathetic_schema as _apathetic_schema_class
+    from .namespace import apathetic_schema as apathetic_schema
+    from .types import (
+        ApatheticSchema_SchemaErrorAggregator as ApatheticSchema_SchemaErrorAggregator,
+        ApatheticSchema_SchErrAggEntry as ApatheticSchema_SchErrAggEntry,
+        ApatheticSchema_ValidationSummary as ApatheticSchema_ValidationSummary,
+    )
 
-# Import types for export (available at both type checking and runtime)
-from .types import (
-    ApatheticSchema_SchemaErrorAggregator,
-    ApatheticSchema_SchErrAggEntry,
-    ApatheticSchema_ValidationSummary,
-)
+    # Method and constant aliases (resolved lazily at runtime below)
+    check_schema_conformance = apathetic_schema.check_schema_conformance
+    collect_msg = apathetic_schema.collect_msg
+    flush_schema_aggregators = apathetic_schema.flush_schema_aggregators
+    warn_keys_batch = apathetic_schema.warn_keys_batch
+    warn_keys_once = apathetic_schema.warn_keys_once
+    validate_typed_dict = apathetic_schema.validate_typed_dict
+    DEFAULT_HINT_CUTOFF = apathetic_schema.DEFAULT_HINT_CUTOFF
+    AGG_STRICT_WARN = apathetic_schema.AGG_STRICT_WARN
+    AGG_WARN = apathetic_schema.AGG_WARN
 
 
-# Get reference to the namespace class
-# In stitched mode: class is already defined in namespace.py (executed before this)
-# In package mode: import from namespace module
+# Detect stitched mode early: in stitched builds all submodules execute in
+# this single module namespace, so the classes below are already in globals()
+# and importlib must not be asked for submodules that don't exist on disk.
 _apathetic_schema_is_stitched = globals().get("__STITCHED__", False)
 
-if _apathetic_schema_is_stitched:
-    # Stitched mode: class already defined in namespace.py
-    # Get reference to the class (it's already in globals from namespace.py)
-    _apathetic_schema_raw = globals().get("apathetic_schema")
-    if _apathetic_schema_raw is None:
-        # Fallback: should not happen, but handle gracefully
-        msg = "apathetic_schema class not found in stitched mode"
-        raise RuntimeError(msg)
-    # Type cast to help mypy understand this is the apathetic_schema class
-    # The import gives us type[apathetic_schema], so cast to
-    # type[_apathetic_schema_class]
-    apathetic_schema = cast("type[_apathetic_schema_class]", _apathetic_schema_raw)
-else:
-    # Package mode: import from namespace module
-    # This block is only executed in package mode, not in stitched builds
-    from .namespace import apathetic_schema
-
-    # Ensure the else block is not empty (build script may remove import)
-    _ = apathetic_schema
-
-# Export mixin classes and types directly
-# Types are exported from apathetic_schema class below
-
-
-# Export methods and attributes from apathetic_schema class for direct import
-check_schema_conformance = apathetic_schema.check_schema_conformance
-collect_msg = apathetic_schema.collect_msg
-flush_schema_aggregators = apathetic_schema.flush_schema_aggregators
-warn_keys_once = apathetic_schema.warn_keys_once
-validate_typed_dict = apathetic_schema.validate_typed_dict
-
-# Export constants from apathetic_schema class
-DEFAULT_HINT_CUTOFF = apathetic_schema.DEFAULT_HINT_CUTOFF
-AGG_STRICT_WARN = apathetic_schema.AGG_STRICT_WARN
-AGG_WARN = apathetic_schema.AGG_WARN
-
-# Export type aliases and dataclasses
-# Types are imported from types module above
+
+# Lazy export table (PEP 562): attribute name -> (submodule, dotted path).
+# Nothing is imported until the attribute is first accessed; the resolved
+# object is cached into globals() so later lookups bypass __getattr__.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "apathetic_schema": ("apathetic_schema.namespace", "apathetic_schema"),
+    "ApatheticSchema_SchErrAggEntry": (
+        "apathetic_schema.types",
+        "ApatheticSchema_SchErrAggEntry",
+    ),
+    "ApatheticSchema_SchemaErrorAggregator": (
+        "apathetic_schema.types",
+        "ApatheticSchema_SchemaErrorAggregator",
+    ),
+    "ApatheticSchema_ValidationSummary": (
+        "apathetic_schema.types",
+        "ApatheticSchema_ValidationSummary",
+    ),
+    "check_schema_conformance": (
+        "apathetic_schema.namespace",
+        "apathetic_schema.check_schema_conformance",
+    ),
+    "collect_msg": ("apathetic_schema.namespace", "apathetic_schema.collect_msg"),
+    "flush_schema_aggregators": (
+        "apathetic_schema.namespace",
+        "apathetic_schema.flush_schema_aggregators",
+    ),
+    "warn_keys_batch": (
+        "apathetic_schema.namespace",
+        "apathetic_schema.warn_keys_batch",
+    ),
+    "warn_keys_once": (
+        "apathetic_schema.namespace",
+        "apathetic_schema.warn_keys_once",
+    ),
+    "validate_typed_dict": (
+        "apathetic_schema.namespace",
+        "apathetic_schema.validate_typed_dict",
+    ),
+    "DEFAULT_HINT_CUTOFF": (
+        "apathetic_schema.constants",
+        "ApatheticSchema_DEFAULT_HINT_CUTOFF",
+    ),
+    "AGG_STRICT_WARN": (
+        "apathetic_schema.constants",
+        "ApatheticSchema_AGG_STRICT_WARN",
+    ),
+    "AGG_WARN": ("apathetic_schema.constants", "ApatheticSchema_AGG_WARN"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exported attributes on first access (PEP 562)."""
+    try:
+        module_name, attr_path = _LAZY_EXPORTS[name]
+    except KeyError:
+        xmsg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(xmsg) from None
+
+    parts = attr_path.split(".")
+    if _apathetic_schema_is_stitched:
+        # Stitched mode: the root object is already defined in this module's
+        # namespace (submodules were executed inline before __init__).
+        obj = globals().get(parts[0])
+        if obj is None:
+            xmsg = f"{parts[0]} not found in stitched module namespace"
+            raise RuntimeError(xmsg)
+        parts = parts[1:]
+    else:
+        import importlib  # noqa: PLC0415
+        from types import ModuleType  # noqa: PLC0415
+
+        obj = importlib.import_module(module_name)
+
+        # Importing a submodule binds it as an attribute of this package,
+        # which would shadow same-named function aliases (e.g. the
+        # `warn_keys_once` submodule vs. the exported function). Drop any
+        # module bindings for lazily-exported names so __getattr__ stays
+        # authoritative for them.
+        for export_name in _LAZY_EXPORTS:
+            if isinstance(globals().get(export_name), ModuleType):
+                del globals()[export_name]
+
+    for part in parts:
+        obj = getattr(obj, part)
+
+    # Cache so subsequent lookups short-circuit __getattr__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Include lazily-exported names alongside the real module globals."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+# Debug/CI knob: resolve every lazy export at import time so a broken lazy
+# target fails loudly here instead of at its first production use. Costs
+# nothing on the default (lazy) path.
+if os.environ.get("APATHETIC_SCHEMA_EAGER_IMPORT"):
+    for _apathetic_schema_export in list(_LAZY_EXPORTS):
+        __getattr__(_apathetic_schema_export)
+    del _apathetic_schema_export
 
 
 __all__ = [
@@ -71,5 +146,6 @@ __all__ = [
     "collect_msg",
     "flush_schema_aggregators",
     "validate_typed_dict",
+    "warn_keys_batch",
     "warn_keys_once",
 ]
@@ -3,15 +3,55 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, Final, TypedDict
 
 from .validate_typed_dict import ApatheticSchema_Internal_ValidateTypedDict
 
 
 if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
     from .types import ApatheticSchema_ValidationSummary
 
 
+#: Entries kept before the anonymous-TypedDict cache is flushed wholesale
+_APATHETIC_SCHEMA_ANON_CACHE_MAX: Final[int] = 128
+
+# Cache keyed on schema-dict identity: callers pass the same module-level
+# schema dict on every call, and synthesizing a TypedDict class per call
+# runs the full type-creation machinery each time. Entries hold a strong
+# reference to the schema dict so its id() cannot be reused while cached;
+# the identity check below stays as a cheap guard regardless. A content
+# fingerprint (the schema's items) is stored alongside so a caller that
+# mutates its schema dict between calls gets a fresh class — the derived
+# per-class caches in validate_typed_dict would otherwise keep serving
+# the pre-mutation schema. Reusing the class also lets those per-class
+# schema/descriptor caches actually hit across calls.
+_apathetic_schema_anon_cache: dict[
+    int, tuple[dict[str, Any], tuple[tuple[str, Any], ...], type[Any]]
+] = {}
+
+
+def _apathetic_schema_anon_typeddict(schema: dict[str, Any]) -> type[Any]:
+    """Return a (cached) TypedDict class carrying ``schema`` as annotations."""
+    fingerprint = tuple(schema.items())
+    entry = _apathetic_schema_anon_cache.get(id(schema))
+    if entry is not None and entry[0] is schema and entry[1] == fingerprint:
+        return entry[2]
+
+    # Pretend schema is a TypedDict for uniformity
+    class _AnonTypedDict(TypedDict):
+        pass
+
+    # Attach the schema dynamically to mimic schema_from_typeddict output
+    _AnonTypedDict.__annotations__ = schema
+
+    if len(_apathetic_schema_anon_cache) >= _APATHETIC_SCHEMA_ANON_CACHE_MAX:
+        _apathetic_schema_anon_cache.clear()
+    _apathetic_schema_anon_cache[id(schema)] = (schema, fingerprint, _AnonTypedDict)
+    return _AnonTypedDict
+
+
 class ApatheticSchema_Internal_CheckSchemaConformance:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Mixin class that provides schema conformance checking functionality.
 
@@ -20,6 +60,8 @@ class ApatheticSchema_Internal_CheckSchemaConformance:  # noqa: N801  # pyright:
     provides the check_schema_conformance method.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def check_schema_conformance(
         cfg: dict[str, Any],
@@ -28,8 +70,8 @@ class ApatheticSchema_Internal_CheckSchemaConformance:  # noqa: N801  # pyright:
         *,
         strict_config: bool,
         summary: ApatheticSchema_ValidationSummary,  # modified in-place
-        prewarn: set[str] | None = None,
-        ignore_keys: set[str] | None = None,
+        prewarn: AbstractSet[str] | None = None,
+        ignore_keys: AbstractSet[str] | None = None,
         base_path: str = "root",
         field_examples: dict[str, str] | None = None,
     ) -> bool:
@@ -49,22 +91,17 @@ class ApatheticSchema_Internal_CheckSchemaConformance:  # noqa: N801  # pyright:
         Returns:
             True if validation passed, False otherwise
         """
+        # Shared immutable empty default — avoids two set allocations
+        # per call on the common no-skip path
         if prewarn is None:
-            prewarn = set()
+            prewarn = frozenset()
         if ignore_keys is None:
-            ignore_keys = set()
-
-        # Pretend schema is a TypedDict for uniformity
-        class _AnonTypedDict(TypedDict):
-            pass
-
-        # Attach the schema dynamically to mimic schema_from_typeddict output
-        _AnonTypedDict.__annotations__ = schema
+            ignore_keys = frozenset()
 
         return ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
             context,
             cfg,
-            _AnonTypedDict,
+            _apathetic_schema_anon_typeddict(schema),
             strict=strict_config,
             summary=summary,
             prewarn=prewarn,
@@ -18,6 +18,8 @@ class ApatheticSchema_Internal_CollectMsg:  # noqa: N801  # pyright: ignore[repo
     When mixed into apathetic_schema, it provides the collect_msg method.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def collect_msg(
         msg: str,
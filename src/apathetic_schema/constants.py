@@ -3,19 +3,35 @@
 
 from __future__ import annotations
 
-from typing import ClassVar
+from typing import ClassVar, Final
+
+
+# Module-level constants: internal call sites bind these directly so each
+# access is a plain global/module-dict lookup with no class indirection.
+# Names carry the ApatheticSchema_ prefix so they stay collision-safe when
+# stitched into a shared global namespace.
+
+#: Default cutoff for similarity matching in error hints
+ApatheticSchema_DEFAULT_HINT_CUTOFF: Final[float] = 0.75
+
+#: Aggregator severity bucket names
+ApatheticSchema_AGG_STRICT_WARN: Final[str] = "strict_warnings"
+ApatheticSchema_AGG_WARN: Final[str] = "warnings"
 
 
 class ApatheticSchema_Internal_Constants:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Constants for apathetic schema functionality.
 
-    This class contains all constant values used by apathetic_schema.
-    It's kept separate for organizational purposes.
+    This class mirrors the module-level constants above so the values stay
+    reachable through the apathetic_schema namespace class (and any existing
+    consumers of this mixin).
     """
 
+    __slots__ = ()
+
     # Default cutoff for similarity matching in error hints
-    DEFAULT_HINT_CUTOFF: ClassVar[float] = 0.75
+    DEFAULT_HINT_CUTOFF: ClassVar[float] = ApatheticSchema_DEFAULT_HINT_CUTOFF
 
     # Aggregator severity bucket names
-    AGG_STRICT_WARN: ClassVar[str] = "strict_warnings"
-    AGG_WARN: ClassVar[str] = "warnings"
+    AGG_STRICT_WARN: ClassVar[str] = ApatheticSchema_AGG_STRICT_WARN
+    AGG_WARN: ClassVar[str] = ApatheticSchema_AGG_WARN
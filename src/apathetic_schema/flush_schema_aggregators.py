@@ -6,7 +6,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from .collect_msg import ApatheticSchema_Internal_CollectMsg
-from .constants import ApatheticSchema_Internal_Constants
+from .constants import (
+    ApatheticSchema_AGG_STRICT_WARN,
+    ApatheticSchema_AGG_WARN,
+)
 
 
 if TYPE_CHECKING:
@@ -16,6 +19,22 @@ if TYPE_CHECKING:
     )
 
 
+def _apathetic_schema_clean_context(ctx: str) -> str:
+    """Normalize a context string by removing a leading 'in' or 'on'.
+
+    warn_keys_once applies this once at insert time, so internally built
+    aggregator entries arrive pre-cleaned; flushing still runs it as a
+    cheap head check for entries built by external callers.
+    """
+    ctx = ctx.strip()
+    # Only the first three characters matter, so lowercase just
+    # that slice instead of allocating a full lowered copy
+    head = ctx[:3].lower()
+    if head in ("in ", "on "):
+        return ctx[3:].strip()
+    return ctx
+
+
 class ApatheticSchema_Internal_FlushSchemaAggregators:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Mixin class that provides schema aggregator flushing functionality.
 
@@ -24,6 +43,8 @@ class ApatheticSchema_Internal_FlushSchemaAggregators:  # noqa: N801  # pyright:
     provides the flush_schema_aggregators method.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def flush_schema_aggregators(
         *,
@@ -37,14 +58,6 @@ class ApatheticSchema_Internal_FlushSchemaAggregators:  # noqa: N801  # pyright:
             agg: Schema error aggregator containing grouped messages
         """
 
-        def _clean_context(ctx: str) -> str:
-            """Normalize context strings by removing leading 'in' or 'on'."""
-            ctx = ctx.strip()
-            for prefix in ("in ", "on "):
-                if ctx.lower().startswith(prefix):
-                    return ctx[len(prefix) :].strip()
-            return ctx
-
         def _flush_one(
             bucket: dict[str, dict[str, Any]],
             *,
@@ -52,7 +65,9 @@ class ApatheticSchema_Internal_FlushSchemaAggregators:  # noqa: N801  # pyright:
         ) -> None:
             for tag, entry in bucket.items():
                 msg_tmpl = entry["msg"]
-                contexts = [_clean_context(c) for c in entry["contexts"]]
+                contexts = [
+                    _apathetic_schema_clean_context(c) for c in entry["contexts"]
+                ]
                 joined_ctx = ", ".join(contexts)
                 rendered = msg_tmpl.format(keys=tag, ctx=f"in {joined_ctx}")
                 ApatheticSchema_Internal_CollectMsg.collect_msg(
@@ -60,8 +75,8 @@ class ApatheticSchema_Internal_FlushSchemaAggregators:  # noqa: N801  # pyright:
                 )
             bucket.clear()
 
-        strict_bucket = agg.get(ApatheticSchema_Internal_Constants.AGG_STRICT_WARN, {})
-        warn_bucket = agg.get(ApatheticSchema_Internal_Constants.AGG_WARN, {})
+        strict_bucket = agg.get(ApatheticSchema_AGG_STRICT_WARN, {})
+        warn_bucket = agg.get(ApatheticSchema_AGG_WARN, {})
 
         if strict_bucket:
             summary.valid = False
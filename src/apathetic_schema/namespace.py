@@ -41,6 +41,25 @@ class apathetic_schema(  # noqa: N801
     stitched script.
     """
 
+    __slots__ = ()
+
+
+# Flatten inherited attributes into the class's own __dict__ so that each
+# `apathetic_schema.X` access is a single class-dict lookup instead of an
+# MRO walk through the mixin parents. Walking __mro__ in order and keeping
+# the first definition preserves normal resolution semantics. The class
+# itself stays a class (not a module) because embedded/stitched builds rely
+# on it being the only name the library adds to the global namespace.
+for _apathetic_schema_base in apathetic_schema.__mro__[1:-1]:
+    for _apathetic_schema_attr, _apathetic_schema_val in vars(
+        _apathetic_schema_base
+    ).items():
+        if _apathetic_schema_attr.startswith("_"):
+            continue
+        if _apathetic_schema_attr not in vars(apathetic_schema):
+            setattr(apathetic_schema, _apathetic_schema_attr, _apathetic_schema_val)
+del _apathetic_schema_base, _apathetic_schema_attr, _apathetic_schema_val
+
 
 # Note: All exports are handled in __init__.py
 # - For library builds (package/stitched): __init__.py is included, exports happen
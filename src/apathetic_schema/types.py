@@ -49,3 +49,16 @@ class ApatheticSchema_ValidationSummary:  # noqa: N801
     strict_warnings: list[str]
     warnings: list[str]
     strict: bool  # strictness somewhere in our config?
+
+    def reset(self) -> None:
+        """Return the summary to a clean pre-validation state.
+
+        Clears the message buckets in place and marks the summary valid
+        again, so one instance can be reused across batched validations
+        instead of allocating a fresh summary per record. Strictness is
+        retained.
+        """
+        self.valid = True
+        self.errors.clear()
+        self.strict_warnings.clear()
+        self.warnings.clear()
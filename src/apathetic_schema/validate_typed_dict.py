@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 
+import fnmatch
+import re
 from difflib import get_close_matches
-from typing import TYPE_CHECKING, Any, cast, get_args, get_origin
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final, cast, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 from apathetic_utils import (
     cast_hint,
@@ -16,90 +20,279 @@ from apathetic_utils import (
 from typing_extensions import NotRequired
 
 from .collect_msg import ApatheticSchema_Internal_CollectMsg
-from .constants import ApatheticSchema_Internal_Constants
+from .constants import ApatheticSchema_DEFAULT_HINT_CUTOFF
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Set as AbstractSet
+
     from .types import ApatheticSchema_ValidationSummary
 
 
-class ApatheticSchema_Internal_ValidateTypedDict:  # noqa: N801  # pyright: ignore[reportUnusedClass]
-    """Mixin class that provides TypedDict validation functionality.
+#: Unknown keys shorter than this get no typo hint — SequenceMatcher
+#: rarely produces a useful suggestion for 1-2 character keys
+_APATHETIC_SCHEMA_MIN_HINT_KEY_LEN: Final[int] = 3
 
-    This class contains the validate_typed_dict function for validating
-    dictionaries against TypedDict schemas. When mixed into apathetic_schema,
-    it provides the validate_typed_dict method.
+#: Schemas wider than this prefilter hint candidates by first character
+_APATHETIC_SCHEMA_WIDE_SCHEMA_KEYS: Final[int] = 50
+
+#: Shared immutable empty key set: reused wherever prewarn/ignore_keys
+#: default to "nothing", instead of allocating a fresh set per call
+_APATHETIC_SCHEMA_EMPTY_KEYS: Final[frozenset[str]] = frozenset()
+
+#: Concrete builtin scalar types that can never raise from isinstance,
+#: so their checks skip the defensive try/except entirely
+_APATHETIC_SCHEMA_BUILTIN_SCALARS: Final[tuple[type[Any], ...]] = (
+    int,
+    str,
+    float,
+    bool,
+    bytes,
+)
+
+# Memoization keyed on class identity: validating a list of TypedDicts
+# re-enters validate_typed_dict once per element, and without these caches
+# the same schema would be re-derived via reflection every time. Weak keys
+# keep dynamically created schema classes collectible.
+_apathetic_schema_schema_cache: WeakKeyDictionary[type[Any], dict[str, Any]] = (
+    WeakKeyDictionary()
+)
+_apathetic_schema_descriptor_cache: WeakKeyDictionary[
+    type[Any], tuple[tuple[str, Any, bool, Any, bool], ...]
+] = WeakKeyDictionary()
+_apathetic_schema_validator_cache: WeakKeyDictionary[type[Any], Callable[..., bool]] = (
+    WeakKeyDictionary()
+)
+
+
+def _apathetic_schema_cached_schema(typedict_cls: type[Any]) -> dict[str, Any]:
+    """Memoized schema_from_typeddict keyed on class identity."""
+    schema = _apathetic_schema_schema_cache.get(typedict_cls)
+    if schema is None:
+        schema = schema_from_typeddict(typedict_cls)
+        _apathetic_schema_schema_cache[typedict_cls] = schema
+    return schema
+
+
+def _apathetic_schema_infer_type_label_uncached(expected_type: Any) -> str:
+    """Compute a readable label for a type (see _infer_type_label)."""
+    try:
+        origin = get_origin(expected_type)
+        args = get_args(expected_type)
+
+        # Unwrap NotRequired to get the actual type
+        if origin is NotRequired and args:
+            return _apathetic_schema_infer_type_label(args[0])
+
+        if origin is list and args:
+            inner = _apathetic_schema_infer_type_label(args[0])
+            return f"list[{inner}]"
+
+        if isinstance(expected_type, type):
+            return expected_type.__name__
+
+        # Fallback for other types
+        return str(expected_type)
+    except Exception:  # noqa: BLE001
+        return str(expected_type)
+
+
+_apathetic_schema_infer_type_label_cached = lru_cache(maxsize=1024)(
+    _apathetic_schema_infer_type_label_uncached
+)
+
+
+def _apathetic_schema_infer_type_label(expected_type: Any) -> str:
+    """Memoized type-label computation.
+
+    The label depends only on the type object, and the hot validation paths
+    ask for it repeatedly, so results are cached. Unhashable typing
+    constructs fall back to an uncached computation.
     """
+    try:
+        return _apathetic_schema_infer_type_label_cached(expected_type)
+    except TypeError:
+        return _apathetic_schema_infer_type_label_uncached(expected_type)
 
-    @staticmethod
-    def _get_example_for_field(
-        field_path: str,
-        field_examples: dict[str, str] | None = None,
-    ) -> str | None:
-        """Get example for field if available in field_examples.
-
-        Args:
-            field_path: The full field path
-                (e.g. "root.include" or "root.watch_interval")
-            field_examples: Optional dict mapping field patterns to example values.
-            If None, returns None (no examples available).
-        """
-        if field_examples is None:
-            return None
-
-        # First, try exact match (O(1) lookup)
-        if field_path in field_examples:
-            return field_examples[field_path]
-
-        # Then try wildcard matches
-        for pattern, example in field_examples.items():
-            if "*" in pattern and fnmatchcase_portable(field_path, pattern):
-                return example
 
-        return None
+def _apathetic_schema_is_typeddict_uncached(candidate: Any) -> bool:
+    """TypedDict-class probe shared by the field and list validators."""
+    return (
+        isinstance(candidate, type)
+        and hasattr(candidate, "__annotations__")
+        and hasattr(candidate, "__total__")
+    )
 
-    @staticmethod
-    def _infer_type_label(
-        expected_type: Any,
-    ) -> str:
-        """Return a readable label for logging (e.g. 'list[str]', 'BuildConfig')."""
-        try:
-            origin = get_origin(expected_type)
-            args = get_args(expected_type)
 
-            # Unwrap NotRequired to get the actual type
-            if origin is NotRequired and args:
-                return ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
-                    args[0]
-                )
+_apathetic_schema_is_typeddict_cached = lru_cache(maxsize=512)(
+    _apathetic_schema_is_typeddict_uncached
+)
 
-            if origin is list and args:
-                inner = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
-                    args[0]
-                )
-                return f"list[{inner}]"
 
-            if isinstance(expected_type, type):
-                return expected_type.__name__
+def _apathetic_schema_is_typeddict(candidate: Any) -> bool:
+    """Memoized TypedDict-class probe.
 
-            # Fallback for other types
-            return str(expected_type)
-        except Exception:  # noqa: BLE001
-            return str(expected_type)
+    The three-attribute check runs hasattr twice per candidate; caching
+    turns repeat probes (one per list element before this existed) into a
+    dict hit. typing.is_typeddict was considered but rejected: the probe
+    deliberately accepts any annotated class with __total__, not only real
+    TypedDict subclasses, and that behavior is covered by tests.
+    """
+    try:
+        return _apathetic_schema_is_typeddict_cached(candidate)
+    except TypeError:
+        return _apathetic_schema_is_typeddict_uncached(candidate)
+
+
+@lru_cache(maxsize=64)
+def _apathetic_schema_compiled_examples(
+    items: tuple[tuple[str, str], ...],
+) -> tuple[
+    re.Pattern[str] | None,
+    tuple[tuple[int, str], ...],
+    tuple[tuple[int, str, str, str], ...],
+]:
+    """Precompile wildcard example patterns for a field_examples mapping.
+
+    Returns (union_regex, examples, fallbacks). Exact patterns are served
+    by the dict lookup in _get_example_for_field and skipped here. Plain
+    '*' globs are translated via fnmatch.translate and joined into one
+    alternation of named groups (?P<g0>...)|(?P<g1>...), so a lookup is a
+    single regex match; examples[i] holds the value for group gi. '**'
+    patterns can't join the union — they need the Python 3.10 fnmatch
+    backport — so they stay as fallback entries with a cheap startswith
+    prefilter on the literal text before the first '*'. Both sides carry
+    each pattern's position in the original mapping so the lookup can
+    restore first-match-wins order across the two kinds.
+    """
+    branches: list[str] = []
+    examples: list[tuple[int, str]] = []
+    fallbacks: list[tuple[int, str, str, str]] = []
+    for pos, (pattern, example) in enumerate(items):
+        if "*" not in pattern:
+            continue
+        if "**" in pattern:
+            prefix = pattern.split("*", 1)[0]
+            fallbacks.append((pos, prefix, pattern, example))
+        else:
+            branches.append(f"(?P<g{len(examples)}>{fnmatch.translate(pattern)})")
+            examples.append((pos, example))
+
+    union = re.compile("|".join(branches)) if branches else None
+    return union, tuple(examples), tuple(fallbacks)
+
+
+@lru_cache(maxsize=4096)
+def _apathetic_schema_join_path(parent: str, key: str) -> str:
+    """Memoized dotted-path join.
+
+    The same (parent, key) pairs recur on every validation of a given
+    schema, so the joined strings are built once and reused instead of
+    allocating a fresh string per field per call.
+    """
+    return f"{parent}.{key}"
 
-    @staticmethod
-    def _validate_scalar_value(
-        context: str,
-        key: str,
-        val: Any,
-        expected_type: Any,
-        *,
-        strict: bool,
-        summary: ApatheticSchema_ValidationSummary,  # modified in-place
-        field_path: str,
-        field_examples: dict[str, str] | None = None,
-    ) -> bool:
-        """Validate a single non-container value against its expected type."""
+
+def _apathetic_schema_field_descriptors(
+    typedict_cls: type[Any],
+) -> tuple[tuple[str, Any, bool, Any, bool], ...]:
+    """Precompute per-field typing reflection for a TypedDict class.
+
+    Returns a tuple of (field, expected_type, is_list, list_subtype,
+    is_typeddict) entries so the per-field validation loop reads plain
+    values instead of re-running get_origin/get_args on every call.
+    """
+    descriptors = _apathetic_schema_descriptor_cache.get(typedict_cls)
+    if descriptors is not None:
+        return descriptors
+
+    built: list[tuple[str, Any, bool, Any, bool]] = []
+    for field, expected_type in _apathetic_schema_cached_schema(typedict_cls).items():
+        origin = get_origin(expected_type)
+        args = get_args(expected_type)
+        is_list = origin is list
+        subtype = args[0] if (is_list and args) else Any
+        is_typeddict = _apathetic_schema_is_typeddict(expected_type)
+        built.append((field, expected_type, is_list, subtype, is_typeddict))
+
+    descriptors = tuple(built)
+    _apathetic_schema_descriptor_cache[typedict_cls] = descriptors
+    return descriptors
+
+
+# The validator implementations live at module scope so the (deeply
+# recursive) hot path resolves callees via plain global lookup instead of
+# a class-attribute descriptor per call. The mixin class below re-exports
+# them as staticmethods for API compatibility.
+
+
+def _apathetic_schema_get_example_for_field(
+    field_path: str,
+    field_examples: dict[str, str] | None = None,
+) -> str | None:
+    """Get example for field if available in field_examples.
+
+    Args:
+        field_path: The full field path
+            (e.g. "root.include" or "root.watch_interval")
+        field_examples: Optional dict mapping field patterns to example values.
+        If None, returns None (no examples available).
+    """
+    if field_examples is None:
+        return None
+
+    # First, try exact match (O(1) lookup)
+    if field_path in field_examples:
+        return field_examples[field_path]
+
+    # Then try wildcard matches against the precompiled union regex;
+    # alternation picks the earliest matching '*' branch
+    union, examples, fallbacks = _apathetic_schema_compiled_examples(
+        tuple(field_examples.items())
+    )
+    union_pos = -1
+    union_example: str | None = None
+    if union is not None:
+        m = union.match(field_path)
+        if m is not None and m.lastgroup is not None:
+            union_pos, union_example = examples[int(m.lastgroup[1:])]
+    # Fallbacks run in mapping order, so the first '**' hit is the
+    # earliest one; a '**' pattern only wins when it precedes the union
+    # hit in the original mapping (first-match-wins across both kinds)
+    for pos, prefix, pattern, example in fallbacks:
+        if union_example is not None and pos > union_pos:
+            break
+        if prefix and not field_path.startswith(prefix):
+            continue
+        if fnmatchcase_portable(field_path, pattern):
+            return example
+
+    return union_example
+
+
+def _apathetic_schema_validate_scalar_value(
+    context: str,
+    key: str,
+    val: Any,
+    expected_type: Any,
+    *,
+    strict: bool,
+    summary: ApatheticSchema_ValidationSummary,  # modified in-place
+    field_path: str,
+    field_examples: dict[str, str] | None = None,
+) -> bool:
+    """Validate a single non-container value against its expected type."""
+    # Exact-type fast path: safe for any expected_type (typing generics
+    # are never the concrete type of a value) and avoids isinstance and
+    # try/except frame setup for the overwhelmingly common case
+    if type(val) is expected_type:
+        return True
+    if expected_type in _APATHETIC_SCHEMA_BUILTIN_SCALARS:
+        # Builtin isinstance cannot raise; only subclass cases (e.g.
+        # bool values for int fields) remain after the exact-type miss
+        if isinstance(val, expected_type):
+            return True
+    else:
         try:
             if safe_isinstance(val, expected_type):  # self-ref guard
                 return True
@@ -113,317 +306,354 @@ class ApatheticSchema_Internal_ValidateTypedDict:  # noqa: N801  # pyright: igno
             if isinstance(val, fallback_type):
                 return True
 
-        exp_label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
-            expected_type
-        )
-        example = ApatheticSchema_Internal_ValidateTypedDict._get_example_for_field(
-            field_path, field_examples
-        )
+    exp_label = _apathetic_schema_infer_type_label(expected_type)
+    example = _apathetic_schema_get_example_for_field(field_path, field_examples)
+    exmsg = ""
+    if example:
+        exmsg = f" (e.g. {example})"
+
+    msg = (
+        f"{context}: key `{key}` expected {exp_label}{exmsg}, got {type(val).__name__}"
+    )
+    ApatheticSchema_Internal_CollectMsg.collect_msg(
+        msg, summary=summary, strict=strict, is_error=True
+    )
+    return False
+
+
+def _apathetic_schema_validate_list_value(
+    context: str,
+    key: str,
+    val: Any,
+    subtype: Any,
+    *,
+    strict: bool,
+    summary: ApatheticSchema_ValidationSummary,  # modified in-place
+    prewarn: AbstractSet[str],
+    field_path: str,
+    field_examples: dict[str, str] | None = None,
+    visited: set[tuple[int, int]] | None = None,
+) -> bool:
+    """Validate a homogeneous list value.
+
+    Delegates to scalar/TypedDict validators.
+    """
+    if not isinstance(val, list):
+        type_label = _apathetic_schema_infer_type_label(subtype)
+        exp_label = f"list[{type_label}]"
+        example = _apathetic_schema_get_example_for_field(field_path, field_examples)
         exmsg = ""
         if example:
             exmsg = f" (e.g. {example})"
-
         msg = (
             f"{context}: key `{key}` expected {exp_label}{exmsg},"
             f" got {type(val).__name__}"
         )
         ApatheticSchema_Internal_CollectMsg.collect_msg(
-            msg, summary=summary, strict=strict, is_error=True
+            msg,
+            strict=strict,
+            summary=summary,
+            is_error=True,
         )
         return False
 
-    @staticmethod
-    def _validate_list_value(
-        context: str,
-        key: str,
-        val: Any,
-        subtype: Any,
-        *,
-        strict: bool,
-        summary: ApatheticSchema_ValidationSummary,  # modified in-place
-        prewarn: set[str],
-        field_path: str,
-        field_examples: dict[str, str] | None = None,
-    ) -> bool:
-        """Validate a homogeneous list value.
-
-        Delegates to scalar/TypedDict validators.
-        """
-        if not isinstance(val, list):
-            type_label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
-                subtype
-            )
-            exp_label = f"list[{type_label}]"
-            example = ApatheticSchema_Internal_ValidateTypedDict._get_example_for_field(
-                field_path, field_examples
-            )
-            exmsg = ""
-            if example:
-                exmsg = f" (e.g. {example})"
-            msg = (
-                f"{context}: key `{key}` expected {exp_label}{exmsg},"
-                f" got {type(val).__name__}"
-            )
-            ApatheticSchema_Internal_CollectMsg.collect_msg(
-                msg,
-                strict=strict,
-                summary=summary,
-                is_error=True,
-            )
-            return False
-
-        # Treat val as a real list for static type checkers
-        items = cast_hint(list[Any], val)
+    # Treat val as a real list for static type checkers
+    items = cast_hint(list[Any], val)
 
-        # Empty list → fine, nothing to check
-        if not items:
-            return True
+    # Empty list → fine, nothing to check
+    if not items:
+        return True
 
-        valid = True
+    valid = True
+    # The subtype is loop-invariant: probe it once, branch once, and run
+    # one tight loop per batch with the callee bound to a local
+    if _apathetic_schema_is_typeddict(subtype):
+        # Resolve the specialized validator for the whole batch up front
+        # instead of re-entering validate_typed_dict's guards per item
+        collect_msg = ApatheticSchema_Internal_CollectMsg.collect_msg
+        nested_validator = _apathetic_schema_compiled_validator(subtype)
+        subtype_name = subtype.__name__
         for i, item in enumerate(items):
-            # Detect TypedDict-like subtypes
-            if (
-                isinstance(subtype, type)
-                and hasattr(subtype, "__annotations__")
-                and hasattr(subtype, "__total__")
-            ):
-                if not isinstance(item, dict):
-                    ApatheticSchema_Internal_CollectMsg.collect_msg(
-                        f"{context}: key `{key}` #{i + 1} expected an "
-                        " object with named keys for "
-                        f"{subtype.__name__}, got {type(item).__name__}",
-                        strict=strict,
-                        summary=summary,
-                        is_error=True,
-                    )
-                    valid = False
-                    continue
-
-                valid &= ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
-                    f"{context}.{key}[{i}]",
-                    item,
-                    subtype,
+            if not isinstance(item, dict):
+                collect_msg(
+                    f"{context}: key `{key}` #{i + 1} expected an "
+                    " object with named keys for "
+                    f"{subtype_name}, got {type(item).__name__}",
                     strict=strict,
                     summary=summary,
-                    prewarn=prewarn,
-                    field_path=f"{field_path}[{i}]",
-                    field_examples=field_examples,
-                )
-            else:
-                valid &= (
-                    ApatheticSchema_Internal_ValidateTypedDict._validate_scalar_value(
-                        context,
-                        f"{key}[{i}]",
-                        item,
-                        subtype,
-                        strict=strict,
-                        summary=summary,
-                        field_path=f"{field_path}[{i}]",
-                        field_examples=field_examples,
-                    )
+                    is_error=True,
                 )
-        return valid
-
-    @staticmethod
-    def _dict_unknown_keys(
-        context: str,
-        val: Any,
-        schema: dict[str, Any],
-        *,
-        strict: bool,
-        summary: ApatheticSchema_ValidationSummary,  # modified in-place
-        prewarn: set[str],
-    ) -> bool:
-        """Check for unknown keys in a dictionary value."""
-        # --- Unknown keys ---
-        val_dict = cast("dict[str, Any]", val)
-        unknown: list[str] = [
-            k for k in val_dict if k not in schema and k not in prewarn
-        ]
-        if unknown:
-            joined = ", ".join(f"`{u}`" for u in unknown)
-
-            location = context
-            if "in top-level configuration." in location:
-                location = "in " + location.split("in top-level configuration.")[-1]
-
-            msg = f"Unknown key{plural(unknown)} {joined} {location}."
-
-            hints: list[str] = []
-            for k in unknown:
-                close = get_close_matches(
-                    k,
-                    schema.keys(),
-                    n=1,
-                    cutoff=ApatheticSchema_Internal_Constants.DEFAULT_HINT_CUTOFF,
-                )
-                if close:
-                    hints.append(f"'{k}' → '{close[0]}'")
-            if hints:
-                msg += "\nHint: did you mean " + ", ".join(hints) + "?"
+                valid = False
+                continue
 
-            ApatheticSchema_Internal_CollectMsg.collect_msg(
-                msg.strip(), strict=strict, summary=summary
+            valid &= nested_validator(
+                f"{context}.{key}[{i}]",
+                item,
+                strict=strict,
+                summary=summary,
+                prewarn=prewarn,
+                ignore_keys=_APATHETIC_SCHEMA_EMPTY_KEYS,
+                field_path=f"{field_path}[{i}]",
+                field_examples=field_examples,
+                visited=visited,
             )
-            if strict:
-                return False
-
+    else:
+        # Bulk fast path: a single tight scan accepts a fully
+        # exact-typed list without entering the per-element validator;
+        # mixed or failing lists fall through for per-item messages
+        if isinstance(subtype, type) and all(type(item) is subtype for item in items):
+            return True
+        validate_scalar = _apathetic_schema_validate_scalar_value
+        for i, item in enumerate(items):
+            valid &= validate_scalar(
+                context,
+                f"{key}[{i}]",
+                item,
+                subtype,
+                strict=strict,
+                summary=summary,
+                field_path=f"{field_path}[{i}]",
+                field_examples=field_examples,
+            )
+    return valid
+
+
+def _apathetic_schema_dict_unknown_keys(
+    context: str,
+    val: Any,
+    schema: dict[str, Any],
+    *,
+    strict: bool,
+    summary: ApatheticSchema_ValidationSummary,  # modified in-place
+    prewarn: AbstractSet[str],
+) -> bool:
+    """Check for unknown keys in a dictionary value."""
+    # --- Unknown keys ---
+    val_dict = cast("dict[str, Any]", val)
+    # Subset check first: a clean config (every key known) is the common
+    # case and the keys-view comparison allocates nothing
+    if val_dict.keys() <= schema.keys():
         return True
-
-    @staticmethod
-    def _dict_fields(
-        context: str,
-        val: Any,
-        schema: dict[str, Any],
-        *,
-        strict: bool,
-        summary: ApatheticSchema_ValidationSummary,  # modified in-place
-        prewarn: set[str],
-        ignore_keys: set[str],
-        field_path: str,
-        field_examples: dict[str, str] | None = None,
-    ) -> bool:
-        """Validate dictionary fields against schema."""
-        valid = True
-
-        for field, expected_type in schema.items():
-            if field not in val or field in prewarn or field in ignore_keys:
-                # Optional or missing field → not a failure
+    # Set algebra runs in the dict C core; the comprehension then only
+    # restores the original key order for stable messages
+    unknown_set = val_dict.keys() - schema.keys() - prewarn
+    unknown: list[str] = [k for k in val_dict if k in unknown_set]
+    if unknown:
+        joined = ", ".join(f"`{u}`" for u in unknown)
+
+        location = context
+        if "in top-level configuration." in location:
+            location = "in " + location.split("in top-level configuration.")[-1]
+
+        msg = f"Unknown key{plural(unknown)} {joined} {location}."
+
+        # SequenceMatcher work is O(|schema| * L) per unknown key, so
+        # gate it: exact case-insensitive matches are suggested without
+        # difflib, keys too short to produce useful hints are skipped,
+        # and wide schemas are prefiltered to first-char candidates.
+        hints: list[str] = []
+        schema_keys = tuple(schema)
+        lower_to_key = {s.lower(): s for s in schema_keys}
+        wide_schema = len(schema_keys) > _APATHETIC_SCHEMA_WIDE_SCHEMA_KEYS
+        for k in unknown:
+            if len(k) < _APATHETIC_SCHEMA_MIN_HINT_KEY_LEN:
                 continue
+            exact = lower_to_key.get(k.lower())
+            if exact is not None:
+                hints.append(f"'{k}' → '{exact}'")
+                continue
+            candidates: tuple[str, ...] = schema_keys
+            if wide_schema:
+                first = k[0].lower()
+                candidates = tuple(s for s in schema_keys if s[:1].lower() == first)
+            close = get_close_matches(
+                k,
+                candidates,
+                n=1,
+                cutoff=ApatheticSchema_DEFAULT_HINT_CUTOFF,
+            )
+            if close:
+                hints.append(f"'{k}' → '{close[0]}'")
+        if hints:
+            msg += "\nHint: did you mean " + ", ".join(hints) + "?"
 
-            inner_val = val[field]
-            origin = get_origin(expected_type)
-            args = get_args(expected_type)
-            exp_label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
-                expected_type
+        ApatheticSchema_Internal_CollectMsg.collect_msg(
+            msg.strip(), strict=strict, summary=summary
+        )
+        if strict:
+            return False
+
+    return True
+
+
+def _apathetic_schema_dict_fields(
+    context: str,
+    val: Any,
+    descriptors: tuple[tuple[str, Any, bool, Any, bool], ...],
+    *,
+    strict: bool,
+    summary: ApatheticSchema_ValidationSummary,  # modified in-place
+    prewarn: AbstractSet[str],
+    ignore_keys: AbstractSet[str],
+    field_path: str,
+    field_examples: dict[str, str] | None = None,
+    visited: set[tuple[int, int]] | None = None,
+) -> bool:
+    """Validate dictionary fields against precomputed field descriptors."""
+    valid = True
+    # Loop-invariant: context never changes per field, so scan it once;
+    # local bindings keep the per-field dispatch off global lookups
+    # (LOAD_FAST instead of LOAD_GLOBAL per field)
+    is_toplevel = "in top-level configuration." in context
+    validate_list = _apathetic_schema_validate_list_value
+    validate_nested = _apathetic_schema_validate_typed_dict
+    validate_scalar = _apathetic_schema_validate_scalar_value
+    join_path = _apathetic_schema_join_path
+    # Both skip sets are empty in the common case — check that once so
+    # the per-field path is a single dict membership test
+    check_skips = bool(prewarn) or bool(ignore_keys)
+
+    for field, expected_type, is_list, subtype, is_typeddict in descriptors:
+        if field not in val:
+            # Optional or missing field → not a failure
+            continue
+        if check_skips and (field in prewarn or field in ignore_keys):
+            continue
+
+        inner_val = val[field]
+        current_field_path = join_path(field_path, field) if field_path else field
+
+        if is_list:
+            valid &= validate_list(
+                context,
+                field,
+                inner_val,
+                subtype,
+                strict=strict,
+                summary=summary,
+                prewarn=prewarn,
+                field_path=current_field_path,
+                field_examples=field_examples,
+                visited=visited,
+            )
+        elif is_typeddict:
+            # we don't pass ignore_keys down because
+            # we don't recursively ignore these keys
+            # and they have no depth syntax. Instead you
+            # need to ignore the current level, then take ownership
+            # and only validate what you want manually. calling validation
+            # on anything that you aren't ignoring downstream.
+            # rare case that is a lot of work, but keeps the rest
+            # simple for now.
+            location = field if is_toplevel else join_path(context, field)
+            valid &= validate_nested(
+                location,
+                inner_val,
+                expected_type,
+                strict=strict,
+                summary=summary,
+                prewarn=prewarn,
+                field_path=current_field_path,
+                field_examples=field_examples,
+                _visited=visited,
+            )
+        else:
+            # _validate_scalar_value already emits the error message;
+            # trusting its return avoids a near-duplicate collect_msg
+            valid &= validate_scalar(
+                context,
+                field,
+                inner_val,
+                expected_type,
+                strict=strict,
+                summary=summary,
+                field_path=current_field_path,
+                field_examples=field_examples,
             )
-            current_field_path = f"{field_path}.{field}" if field_path else field
-
-            if origin is list:
-                subtype = args[0] if args else Any
-                valid &= (
-                    ApatheticSchema_Internal_ValidateTypedDict._validate_list_value(
-                        context,
-                        field,
-                        inner_val,
-                        subtype,
-                        strict=strict,
-                        summary=summary,
-                        prewarn=prewarn,
-                        field_path=current_field_path,
-                        field_examples=field_examples,
-                    )
-                )
-            elif (
-                isinstance(expected_type, type)
-                and hasattr(expected_type, "__annotations__")
-                and hasattr(expected_type, "__total__")
-            ):
-                # we don't pass ignore_keys down because
-                # we don't recursively ignore these keys
-                # and they have no depth syntax. Instead you
-                # need to ignore the current level, then take ownership
-                # and only validate what you want manually. calling validation
-                # on anything that you aren't ignoring downstream.
-                # rare case that is a lot of work, but keeps the rest
-                # simple for now.
-                if "in top-level configuration." in context:
-                    location = field
-                else:
-                    location = f"{context}.{field}"
-                valid &= ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
-                    location,
-                    inner_val,
-                    expected_type,
-                    strict=strict,
-                    summary=summary,
-                    prewarn=prewarn,
-                    field_path=current_field_path,
-                    field_examples=field_examples,
-                )
-            else:
-                val_scalar = (
-                    ApatheticSchema_Internal_ValidateTypedDict._validate_scalar_value(
-                        context,
-                        field,
-                        inner_val,
-                        expected_type,
-                        strict=strict,
-                        summary=summary,
-                        field_path=current_field_path,
-                        field_examples=field_examples,
-                    )
-                )
-                if not val_scalar:
-                    ApatheticSchema_Internal_CollectMsg.collect_msg(
-                        f"{context}: key `{field}` expected {exp_label}, "
-                        f"got {type(inner_val).__name__}",
-                        strict=strict,
-                        summary=summary,
-                        is_error=True,
-                    )
-                    valid = False
 
-        return valid
+    return valid
+
 
-    @staticmethod
-    def validate_typed_dict(
+def _apathetic_schema_compiled_validator(
+    typedict_cls: type[Any],
+) -> Callable[..., bool]:
+    """Build (and cache) a validator specialized for one TypedDict class.
+
+    The returned closure captures the class's schema, descriptors and name
+    as cell variables, so repeat validations against the same class skip
+    the per-call cache lookups entirely. This is a closure-specialization
+    take on the "compile schema to validator" idea — exec-based source
+    generation was deliberately avoided since it would bypass the type
+    checkers and complicate the stitched build.
+    """
+    validator = _apathetic_schema_validator_cache.get(typedict_cls)
+    if validator is not None:
+        return validator
+
+    schema = _apathetic_schema_cached_schema(typedict_cls)
+    descriptors = _apathetic_schema_field_descriptors(typedict_cls)
+    cls_name = typedict_cls.__name__
+    cls_id = id(typedict_cls)
+    # Known at compile time: only schemas that can recurse (a nested
+    # TypedDict field, or a list of them) pay for cycle tracking at all
+    can_recurse = any(
+        is_td or (is_list and _apathetic_schema_is_typeddict(subtype))
+        for _, _, is_list, subtype, is_td in descriptors
+    )
+
+    def _validator(
         context: str,
         val: Any,
-        typedict_cls: type[Any],
         *,
         strict: bool,
         summary: ApatheticSchema_ValidationSummary,  # modified in-place
-        prewarn: set[str],
-        ignore_keys: set[str] | None = None,
-        field_path: str = "",
-        field_examples: dict[str, str] | None = None,
+        prewarn: AbstractSet[str],
+        ignore_keys: AbstractSet[str],
+        field_path: str,
+        field_examples: dict[str, str] | None,
+        visited: set[tuple[int, int]] | None = None,
     ) -> bool:
-        """Validate a dict against a TypedDict schema recursively.
-
-        - Return False if val is not a dict
-        - Recurse into its fields using _validate_scalar_value or _validate_list_value
-        - Warn about unknown keys under strict=True
-        """
-        if ignore_keys is None:
-            ignore_keys = set()
-
         if not isinstance(val, dict):
             ApatheticSchema_Internal_CollectMsg.collect_msg(
                 f"{context}: expected an object with named keys for"
-                f" {typedict_cls.__name__}, got {type(val).__name__}",
+                f" {cls_name}, got {type(val).__name__}",
                 strict=strict,
                 summary=summary,
                 is_error=True,
             )
             return False
 
-        if not hasattr(typedict_cls, "__annotations__"):
-            xmsg = (
-                "Internal schema invariant violated: "
-                f"{typedict_cls!r} has no __annotations__."
-            )
-            raise AssertionError(xmsg)
+        # Cycle guard: a (value, schema) pair already on the walk is a
+        # cycle or a DAG-shared subtree — treat the revisit as valid
+        # instead of re-walking (or never returning from) it
+        if can_recurse:
+            pair = (id(val), cls_id)
+            if visited is None:
+                visited = {pair}
+            elif pair in visited:
+                return True
+            else:
+                visited.add(pair)
 
-        schema = schema_from_typeddict(typedict_cls)
         valid = True
 
         # --- walk through all the fields recursively ---
-        if not ApatheticSchema_Internal_ValidateTypedDict._dict_fields(
+        if not _apathetic_schema_dict_fields(
             context,
             val,
-            schema,
+            descriptors,
             strict=strict,
             summary=summary,
             prewarn=prewarn,
             ignore_keys=ignore_keys,
             field_path=field_path,
             field_examples=field_examples,
+            visited=visited,
         ):
             valid = False
 
         # --- Unknown keys ---
-        if not ApatheticSchema_Internal_ValidateTypedDict._dict_unknown_keys(
+        if not _apathetic_schema_dict_unknown_keys(
             context,
             val,
             schema,
@@ -434,3 +664,74 @@ class ApatheticSchema_Internal_ValidateTypedDict:  # noqa: N801  # pyright: igno
             valid = False
 
         return valid
+
+    _apathetic_schema_validator_cache[typedict_cls] = _validator
+    return _validator
+
+
+def _apathetic_schema_validate_typed_dict(
+    context: str,
+    val: Any,
+    typedict_cls: type[Any],
+    *,
+    strict: bool,
+    summary: ApatheticSchema_ValidationSummary,  # modified in-place
+    prewarn: AbstractSet[str],
+    ignore_keys: AbstractSet[str] | None = None,
+    field_path: str = "",
+    field_examples: dict[str, str] | None = None,
+    _visited: set[tuple[int, int]] | None = None,
+) -> bool:
+    """Validate a dict against a TypedDict schema recursively.
+
+    - Return False if val is not a dict
+    - Recurse into its fields using _validate_scalar_value or _validate_list_value
+    - Warn about unknown keys under strict=True
+    - Cyclic or DAG-shared subtrees are validated once, not re-walked
+      (_visited threads the in-flight (value, schema) pairs internally)
+    """
+    if ignore_keys is None:
+        ignore_keys = _APATHETIC_SCHEMA_EMPTY_KEYS
+
+    if not hasattr(typedict_cls, "__annotations__"):
+        xmsg = (
+            "Internal schema invariant violated: "
+            f"{typedict_cls!r} has no __annotations__."
+        )
+        raise AssertionError(xmsg)
+
+    return _apathetic_schema_compiled_validator(typedict_cls)(
+        context,
+        val,
+        strict=strict,
+        summary=summary,
+        prewarn=prewarn,
+        ignore_keys=ignore_keys,
+        field_path=field_path,
+        field_examples=field_examples,
+        visited=_visited,
+    )
+
+
+class ApatheticSchema_Internal_ValidateTypedDict:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides TypedDict validation functionality.
+
+    This class contains the validate_typed_dict function for validating
+    dictionaries against TypedDict schemas. When mixed into apathetic_schema,
+    it provides the validate_typed_dict method.
+
+    The implementations live at module scope (above); the class only
+    re-exports them as staticmethods so namespace and mixin consumers keep
+    the established API.
+    """
+
+    __slots__ = ()
+
+    _get_example_for_field = staticmethod(_apathetic_schema_get_example_for_field)
+    _infer_type_label = staticmethod(_apathetic_schema_infer_type_label)
+    _validate_scalar_value = staticmethod(_apathetic_schema_validate_scalar_value)
+    _validate_list_value = staticmethod(_apathetic_schema_validate_list_value)
+    _dict_unknown_keys = staticmethod(_apathetic_schema_dict_unknown_keys)
+    _dict_fields = staticmethod(_apathetic_schema_dict_fields)
+    _compiled_validator = staticmethod(_apathetic_schema_compiled_validator)
+    validate_typed_dict = staticmethod(_apathetic_schema_validate_typed_dict)
@@ -3,12 +3,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final
 
 from apathetic_utils import cast_hint
 
 from .collect_msg import ApatheticSchema_Internal_CollectMsg
-from .constants import ApatheticSchema_Internal_Constants
+from .constants import (
+    ApatheticSchema_AGG_STRICT_WARN,
+    ApatheticSchema_AGG_WARN,
+)
+from .flush_schema_aggregators import _apathetic_schema_clean_context
 from .types import (
     ApatheticSchema_SchemaErrorAggregator,
     ApatheticSchema_SchErrAggEntry,
@@ -16,6 +22,8 @@ from .types import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence, Set as AbstractSet
+
     from .types import ApatheticSchema_ValidationSummary
 
 
@@ -23,6 +31,94 @@ if TYPE_CHECKING:
 __all__ = ["ApatheticSchema_SchemaErrorAggregator"]
 
 
+# Shared empty result so the disabled-rule / empty-config fast path
+# returns without allocating a fresh set per call
+_APATHETIC_SCHEMA_EMPTY_KEYS: Final[frozenset[str]] = frozenset()
+
+
+@lru_cache(maxsize=256)
+def _apathetic_schema_joined_keys(found: frozenset[str]) -> str:
+    """Memoized sorted, comma-joined rendering of a found-keys set.
+
+    The same few key sets recur across warning calls, so the sort and
+    join run once per distinct set.
+    """
+    return ", ".join(sorted(found))
+
+
+def _apathetic_schema_report_found(
+    tag: str,
+    found: set[str],
+    context: str,
+    msg: str,
+    *,
+    strict_config: bool,
+    summary: ApatheticSchema_ValidationSummary,
+    agg: ApatheticSchema_SchemaErrorAggregator | None,
+) -> bool:
+    """Record found bad keys via the aggregator or immediately.
+
+    Shared tail of warn_keys_once and warn_keys_batch. Returns the
+    per-rule validity (False when strict mode is enabled).
+    """
+    if agg is not None:
+        # Tags and contexts are drawn from a small set of rule
+        # constants, so intern them: repeat bucket lookups and
+        # context-membership tests then compare by pointer identity
+        # instead of character-by-character
+        tag = sys.intern(tag)
+
+        # record context for later aggregation
+        severity = (
+            ApatheticSchema_AGG_STRICT_WARN
+            if strict_config
+            else ApatheticSchema_AGG_WARN
+        )
+
+        bucket = cast_hint(
+            dict[str, ApatheticSchema_SchErrAggEntry],
+            agg.setdefault(severity, {}),
+        )
+
+        # get-then-insert instead of setdefault so the repeat-hit
+        # path doesn't allocate a throwaway default entry per call
+        entry = bucket.get(tag)
+        if entry is None:
+            new_entry: ApatheticSchema_SchErrAggEntry = {
+                "msg": msg,
+                "contexts": [],
+            }
+            bucket[tag] = new_entry
+            entry = new_entry
+        # Normalize once at insert so flushing doesn't re-clean the
+        # same context every time the aggregator is drained; skip
+        # duplicates so a validator re-firing at the same context
+        # (e.g. during nested walks) doesn't grow the entry
+        cleaned = sys.intern(_apathetic_schema_clean_context(context))
+        if cleaned not in entry["contexts"]:
+            entry["contexts"].append(cleaned)
+    else:
+        # immediate fallback
+        ApatheticSchema_Internal_CollectMsg.collect_msg(
+            msg.format(
+                keys=_apathetic_schema_joined_keys(frozenset(found)),
+                ctx=context,
+            ),
+            strict=strict_config,
+            summary=summary,
+        )
+
+    return not strict_config
+
+
+@lru_cache(maxsize=64)
+def _apathetic_schema_bad_keys_lower(
+    bad_keys: frozenset[str],
+) -> dict[str, str]:
+    """Memoized lowercase→original map for a (usually constant) key set."""
+    return {k.lower(): k for k in bad_keys}
+
+
 class ApatheticSchema_Internal_WarnKeysOnce:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Mixin class that provides key warning functionality.
 
@@ -31,6 +127,8 @@ class ApatheticSchema_Internal_WarnKeysOnce:  # noqa: N801  # pyright: ignore[re
     warn_keys_once method.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def warn_keys_once(
         tag: str,
@@ -42,7 +140,7 @@ class ApatheticSchema_Internal_WarnKeysOnce:  # noqa: N801  # pyright: ignore[re
         strict_config: bool,
         summary: ApatheticSchema_ValidationSummary,  # modified in-place
         agg: ApatheticSchema_SchemaErrorAggregator | None,
-    ) -> tuple[bool, set[str]]:
+    ) -> tuple[bool, AbstractSet[str]]:
         """Warn once for known bad keys (e.g. dry-run, root-only).
 
         Args:
@@ -59,47 +157,114 @@ class ApatheticSchema_Internal_WarnKeysOnce:  # noqa: N801  # pyright: ignore[re
             Tuple of (valid, found_keys) where valid indicates if validation
             passed and found_keys contains the keys that were found.
         """
-        valid = True
+        # Disabled rule or empty config: nothing can match, so skip the
+        # intersections and return the shared empty result
+        if not bad_keys or not cfg:
+            return True, _APATHETIC_SCHEMA_EMPTY_KEYS
 
-        # Normalize keys to lowercase for case-insensitive matching
-        bad_keys_lower = {k.lower(): k for k in bad_keys}
-        cfg_keys_lower = {k.lower(): k for k in cfg}
-        found_lower = bad_keys_lower & cfg_keys_lower.keys()
+        # Exact-case intersection first: it runs in the dict C core and
+        # covers the overwhelmingly common path (including "no bad keys
+        # at all") without building any lowercase maps. It is only
+        # terminal when every bad key matched exactly; otherwise the
+        # misses may still match case-insensitively
+        found = set(bad_keys & cfg.keys())
+        if found != bad_keys:
+            # Normalize keys to lowercase for case-insensitive matching;
+            # the bad-keys side is memoized since callers pass constants
+            bad_keys_lower = _apathetic_schema_bad_keys_lower(frozenset(bad_keys))
+            cfg_keys_lower = {k.lower(): k for k in cfg}
+            found_lower = bad_keys_lower.keys() & cfg_keys_lower.keys()
 
-        if not found_lower:
-            return True, set()
+            # Recover original-case keys for display; union with the
+            # exact hits so mixed-case cfgs report every match
+            found |= {cfg_keys_lower[k] for k in found_lower}
 
-        # Recover original-case keys for display
-        found = {cfg_keys_lower[k] for k in found_lower}
+            if not found:
+                return True, _APATHETIC_SCHEMA_EMPTY_KEYS
 
-        if agg is not None:
-            # record context for later aggregation
-            severity = (
-                ApatheticSchema_Internal_Constants.AGG_STRICT_WARN
-                if strict_config
-                else ApatheticSchema_Internal_Constants.AGG_WARN
-            )
+        valid = _apathetic_schema_report_found(
+            tag,
+            found,
+            context,
+            msg,
+            strict_config=strict_config,
+            summary=summary,
+            agg=agg,
+        )
 
-            bucket = cast_hint(
-                dict[str, ApatheticSchema_SchErrAggEntry],
-                agg.setdefault(severity, {}),
-            )
+        return valid, found
 
-            default_entry: ApatheticSchema_SchErrAggEntry = {
-                "msg": msg,
-                "contexts": [],
-            }
-            entry = bucket.setdefault(tag, default_entry)
-            entry["contexts"].append(context)
-        else:
-            # immediate fallback
-            ApatheticSchema_Internal_CollectMsg.collect_msg(
-                f"{msg.format(keys=', '.join(sorted(found)), ctx=context)}",
-                strict=strict_config,
+    @staticmethod
+    def warn_keys_batch(
+        rules: Sequence[tuple[str, set[str], str]],
+        cfg: dict[str, Any],
+        context: str,
+        *,
+        strict_config: bool,
+        summary: ApatheticSchema_ValidationSummary,  # modified in-place
+        agg: ApatheticSchema_SchemaErrorAggregator | None,
+    ) -> tuple[bool, dict[str, AbstractSet[str]]]:
+        """Check many bad-key rules against one cfg in a single sweep.
+
+        Equivalent to calling warn_keys_once per rule, but the
+        case-folded view of cfg is built at most once and shared across
+        all rules instead of once per rule.
+
+        Args:
+            rules: Sequence of (tag, bad_keys, msg) rule triples; tag
+                and msg have the same meaning as in warn_keys_once
+            cfg: Configuration dictionary to check
+            context: Context string for the warnings
+            strict_config: Whether strict mode is enabled
+            summary: Validation summary to modify in-place
+            agg: Optional aggregator for collecting warnings
+
+        Returns:
+            Tuple of (valid, found_by_tag) where valid is False if any
+            rule failed under strict mode and found_by_tag maps each
+            rule's tag to the keys it matched (empty set when clean).
+        """
+        valid = True
+        found_by_tag: dict[str, AbstractSet[str]] = {}
+        if not cfg:
+            for tag, _bad_keys, _msg in rules:
+                found_by_tag[tag] = _APATHETIC_SCHEMA_EMPTY_KEYS
+            return True, found_by_tag
+
+        # Built lazily: rules that hit on the exact-case intersection
+        # (or are empty) never pay for the case-folded view
+        cfg_keys_lower: dict[str, str] | None = None
+
+        for tag, bad_keys, msg in rules:
+            if not bad_keys:
+                found_by_tag[tag] = _APATHETIC_SCHEMA_EMPTY_KEYS
+                continue
+
+            # As in warn_keys_once, the exact-case hits are only terminal
+            # when they cover the whole rule; remaining bad keys may
+            # still match case-insensitively
+            found = set(bad_keys & cfg.keys())
+            if found != bad_keys:
+                if cfg_keys_lower is None:
+                    cfg_keys_lower = {k.lower(): k for k in cfg}
+                bad_keys_lower = _apathetic_schema_bad_keys_lower(frozenset(bad_keys))
+                found_lower = bad_keys_lower.keys() & cfg_keys_lower.keys()
+                found |= {cfg_keys_lower[k] for k in found_lower}
+
+                if not found:
+                    found_by_tag[tag] = _APATHETIC_SCHEMA_EMPTY_KEYS
+                    continue
+
+            rule_valid = _apathetic_schema_report_found(
+                tag,
+                found,
+                context,
+                msg,
+                strict_config=strict_config,
                 summary=summary,
+                agg=agg,
             )
+            valid = valid and rule_valid
+            found_by_tag[tag] = found
 
-        if strict_config:
-            valid = False
-
-        return valid, found
+        return valid, found_by_tag
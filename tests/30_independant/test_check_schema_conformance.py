@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
-import sys
-from typing import Any, TypedDict
+import importlib
+from itertools import chain
+from typing import Any, Final, TypedDict
 
 import pytest
 
@@ -13,10 +14,19 @@ from tests.utils import make_summary
 
 
 # Access internal classes only for testing private methods
-# (runtime_swap handles the swap transparently)
-ApatheticSchema_Internal_ValidateTypedDict = sys.modules[
-    "apathetic_schema.validate_typed_dict"
-].ApatheticSchema_Internal_ValidateTypedDict
+# (runtime_swap handles the swap transparently).
+# The module is bound once here; reuse _VALIDATE_TD_MOD for any other
+# internals rather than re-resolving the module per access. runtime_swap
+# runs before this file imports, so the reference stays valid.
+_VALIDATE_TD_MOD = importlib.import_module("apathetic_schema.validate_typed_dict")
+ApatheticSchema_Internal_ValidateTypedDict = (
+    _VALIDATE_TD_MOD.ApatheticSchema_Internal_ValidateTypedDict
+)
+
+# Facade attribute resolved once at import — every test calls it, and
+# the module-level binding skips the facade lookup per call (runtime_swap
+# completes before this module imports, same invariant as above)
+_check_schema_conformance = amod_schema.check_schema_conformance
 
 
 # ---------------------------------------------------------------------------
@@ -34,7 +44,9 @@ class MiniBuild(TypedDict):
 # --- smoke -----------------------------------------------------
 
 
-def test_check_schema_conformance_respects_prewarn() -> None:
+def test_check_schema_conformance_respects_prewarn(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     """Prewarned keys should be skipped during schema checking."""
     # --- setup ---
     schema: dict[str, Any] = {"include": list[str], "out": str}
@@ -42,8 +54,8 @@ def test_check_schema_conformance_respects_prewarn() -> None:
     prewarn = {"dry_run"}
 
     # --- execute ---
-    summary = make_summary()
-    ok = amod_schema.check_schema_conformance(
+    summary = summary_strict
+    ok = _check_schema_conformance(
         cfg,
         schema,
         "ctx",
@@ -54,34 +66,40 @@ def test_check_schema_conformance_respects_prewarn() -> None:
 
     # --- verify ---
     assert ok is True
-    pool = summary.errors + summary.strict_warnings + summary.warnings
+    pool = chain(summary.errors, summary.strict_warnings, summary.warnings)
     assert not any("dry_run" in m and "unknown key" in m for m in pool)
 
 
 # --- core behavior ---------------------------------------------------------
 
+# Case data lives at module level so collection reuses one tuple; the
+# cases stay parametrized (rather than batched into one looping test)
+# to keep per-case failure isolation.
+_SIMPLE_TYPE_CASES: Final[tuple[tuple[Any, ...], ...]] = (
+    ({"foo": str, "bar": int}, {"foo": "hi", "bar": 42}, False, True),
+    ({"foo": str}, {"foo": 123}, True, False),
+    ({"items": list[str]}, {"items": ["a", "b", "c"]}, False, True),
+    ({"items": list[str]}, {"items": ["a", 42]}, True, False),
+)
+
 
 @pytest.mark.parametrize(
     ("schema", "cfg", "strict_config", "expected_valid"),
-    [
-        ({"foo": str, "bar": int}, {"foo": "hi", "bar": 42}, False, True),
-        ({"foo": str}, {"foo": 123}, True, False),
-        ({"items": list[str]}, {"items": ["a", "b", "c"]}, False, True),
-        ({"items": list[str]}, {"items": ["a", 42]}, True, False),
-    ],
+    _SIMPLE_TYPE_CASES,
 )
 def test_check_schema_conformance_simple_types(
     schema: dict[str, type[Any]],
     cfg: dict[str, Any],
     strict_config: bool,  # noqa: FBT001
     expected_valid: bool,  # noqa: FBT001
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
 ) -> None:
     """Test schema conformance with simple types and lists."""
     # --- setup ---
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
-    result = amod_schema.check_schema_conformance(
+    result = _check_schema_conformance(
         cfg,
         schema,
         "root",
@@ -91,15 +109,56 @@ def test_check_schema_conformance_simple_types(
     assert result is expected_valid
 
 
-def test_list_of_typeddict_allows_dicts() -> None:
+def test_schema_dict_mutation_invalidates_cached_class() -> None:
+    """Mutating a schema dict between calls must not serve stale results."""
+    # --- setup ---
+    schema: dict[str, Any] = {"foo": str}
+    summary_first = make_summary(strict=True)
+
+    # --- execute ---
+    # First call caches the synthesized class for this schema dict
+    assert (
+        _check_schema_conformance(
+            {"foo": "x"},
+            schema,
+            "ctx",
+            strict_config=True,
+            summary=summary_first,
+        )
+        is True
+    )
+
+    # Mutate the same dict object, then validate a cfg that exercises
+    # the new field; a stale cached class would flag `bar` as unknown
+    # instead of type-checking it
+    schema["bar"] = int
+    summary_second = make_summary(strict=True)
+    ok = _check_schema_conformance(
+        {"foo": "x", "bar": "not-int"},
+        schema,
+        "ctx",
+        strict_config=True,
+        summary=summary_second,
+    )
+
+    # --- verify ---
+    assert ok is False
+    assert any("bar" in m and "expected int" in m for m in summary_second.errors)
+    pool = chain(summary_second.strict_warnings, summary_second.warnings)
+    assert not any("unknown key" in m.lower() for m in pool)
+
+
+def test_list_of_typeddict_allows_dicts(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
     schema: dict[str, type[Any]] = {"builds": list[MiniBuild]}
     cfg: dict[str, Any] = {"builds": [{"include": ["src"], "out": "dist"}]}
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
     assert (
-        amod_schema.check_schema_conformance(
+        _check_schema_conformance(
             cfg,
             schema,
             "root",
@@ -110,15 +169,17 @@ def test_list_of_typeddict_allows_dicts() -> None:
     )
 
 
-def test_list_of_typeddict_rejects_non_dict() -> None:
+def test_list_of_typeddict_rejects_non_dict(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
     schema: dict[str, type[Any]] = {"builds": list[MiniBuild]}
     cfg = {"builds": ["bad"]}
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
     assert (
-        amod_schema.check_schema_conformance(
+        _check_schema_conformance(
             cfg,
             schema,
             "root",
@@ -129,15 +190,17 @@ def test_list_of_typeddict_rejects_non_dict() -> None:
     )
 
 
-def test_unknown_keys_fail_in_strict() -> None:
+def test_unknown_keys_fail_in_strict(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
     schema: dict[str, type[Any]] = {"foo": str}
     cfg: dict[str, Any] = {"foo": "x", "unknown": 1}
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
     assert (
-        amod_schema.check_schema_conformance(
+        _check_schema_conformance(
             cfg,
             schema,
             "ctx",
@@ -148,15 +211,17 @@ def test_unknown_keys_fail_in_strict() -> None:
     )
 
 
-def test_unknown_keys_warn_in_non_strict() -> None:
+def test_unknown_keys_warn_in_non_strict(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
     schema: dict[str, type[Any]] = {"foo": str}
     cfg: dict[str, Any] = {"foo": "x", "unknown": 1}
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
     assert (
-        amod_schema.check_schema_conformance(
+        _check_schema_conformance(
             cfg,
             schema,
             "ctx",
@@ -167,16 +232,18 @@ def test_unknown_keys_warn_in_non_strict() -> None:
     )
 
 
-def test_prewarn_keys_ignored() -> None:
+def test_prewarn_keys_ignored(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
     schema: dict[str, type[Any]] = {"foo": str, "bar": int}
     cfg: dict[str, Any] = {"foo": 1, "bar": "oops"}
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
     # prewarn tells it to skip foo
     assert (
-        amod_schema.check_schema_conformance(
+        _check_schema_conformance(
             cfg,
             schema,
             "ctx",
@@ -188,15 +255,17 @@ def test_prewarn_keys_ignored() -> None:
     )
 
 
-def test_list_of_typeddict_with_invalid_inner_type() -> None:
+def test_list_of_typeddict_with_invalid_inner_type(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
     schema = {"builds": list[MiniBuild]}
     cfg: dict[str, Any] = {"builds": [{"include": [123], "out": "dist"}]}
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
     assert (
-        amod_schema.check_schema_conformance(
+        _check_schema_conformance(
             cfg,
             schema,
             "root",
@@ -207,17 +276,19 @@ def test_list_of_typeddict_with_invalid_inner_type() -> None:
     )
 
 
-def test_extra_field_in_typeddict_strict() -> None:
+def test_extra_field_in_typeddict_strict(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
     schema = {"builds": list[MiniBuild]}
     cfg: dict[str, Any] = {
         "builds": [{"include": ["src"], "out": "dist", "weird": True}],
     }
-    summary = make_summary()
+    summary = summary_strict
 
     # --- execute and validate ---
     assert (
-        amod_schema.check_schema_conformance(
+        _check_schema_conformance(
             cfg,
             schema,
             "root",
@@ -5,12 +5,13 @@ from __future__ import annotations
 from typing import cast
 
 import apathetic_schema as amod_schema
-from tests.utils import make_summary
 
 
-def test_flush_schema_aggregators_flushes_strict_bucket() -> None:
+def test_flush_schema_aggregators_flushes_strict_bucket(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
-    summary = make_summary(strict=True)
+    summary = summary_strict
     agg: amod_schema.ApatheticSchema_SchemaErrorAggregator = cast(
         "amod_schema.ApatheticSchema_SchemaErrorAggregator",
         {
@@ -41,9 +42,11 @@ def test_flush_schema_aggregators_flushes_strict_bucket() -> None:
     assert "Ignored config key(s)" in msg
 
 
-def test_flush_schema_aggregators_flushes_warning_bucket() -> None:
+def test_flush_schema_aggregators_flushes_warning_bucket(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
-    summary = make_summary(strict=False)
+    summary = summary_nonstrict
     agg: amod_schema.ApatheticSchema_SchemaErrorAggregator = cast(
         "amod_schema.ApatheticSchema_SchemaErrorAggregator",
         {
@@ -70,9 +73,11 @@ def test_flush_schema_aggregators_flushes_warning_bucket() -> None:
     assert summary.errors == []
 
 
-def test_flush_schema_aggregators_cleans_context_prefixes() -> None:
+def test_flush_schema_aggregators_cleans_context_prefixes(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     # --- setup ---
-    summary = make_summary(strict=True)
+    summary = summary_strict
     agg: amod_schema.ApatheticSchema_SchemaErrorAggregator = cast(
         "amod_schema.ApatheticSchema_SchemaErrorAggregator",
         {
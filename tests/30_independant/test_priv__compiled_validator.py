@@ -0,0 +1,99 @@
+# tests/0_independant/test_priv__compiled_validator.py
+"""Tests for the per-TypedDict compiled validator fastpass."""
+
+# we import `_` private for testing purposes only
+# ruff: noqa: SLF001
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, TypedDict
+
+from tests.utils import make_summary
+
+
+# Access submodule via importlib (runtime_swap handles the swap transparently)
+ApatheticSchema_Internal_ValidateTypedDict = importlib.import_module(
+    "apathetic_schema.validate_typed_dict"
+).ApatheticSchema_Internal_ValidateTypedDict
+
+
+# Method references bound once at import so test bodies skip the
+# class-attribute lookup per call
+_compiled_validator = ApatheticSchema_Internal_ValidateTypedDict._compiled_validator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+# --- Fixtures / Sample TypedDicts -------------------------------------------
+
+
+class MiniBuild(TypedDict):
+    include: list[str]
+    out: str
+
+
+def test_compiled_validator_is_cached_per_class() -> None:
+    # --- execute ---
+    first = _compiled_validator(
+        MiniBuild,
+    )
+    second = _compiled_validator(
+        MiniBuild,
+    )
+
+    # --- verify ---
+    # Same class → same specialized validator, no re-derivation
+    assert first is second
+
+
+def test_compiled_validator_accepts_valid_dict() -> None:
+    # --- setup ---
+    summary = make_summary()
+    validator = _compiled_validator(
+        MiniBuild,
+    )
+    cfg: dict[str, Any] = {"include": ["src"], "out": "dist"}
+
+    # --- execute ---
+    ok = validator(
+        "ctx",
+        cfg,
+        strict=True,
+        summary=summary,
+        prewarn=frozenset(),
+        ignore_keys=frozenset(),
+        field_path="",
+        field_examples=None,
+    )
+
+    # --- verify ---
+    assert ok is True
+    assert summary.errors == []
+
+
+def test_compiled_validator_rejects_non_dict() -> None:
+    # --- setup ---
+    summary = make_summary()
+    validator = _compiled_validator(
+        MiniBuild,
+    )
+
+    # --- execute ---
+    ok = validator(
+        "ctx",
+        "not-a-dict",
+        strict=True,
+        summary=summary,
+        prewarn=frozenset(),
+        ignore_keys=frozenset(),
+        field_path="",
+        field_examples=None,
+    )
+
+    # --- verify ---
+    assert ok is False
+    assert any("MiniBuild" in m for m in summary.errors)
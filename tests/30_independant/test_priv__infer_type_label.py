@@ -5,7 +5,7 @@
 # ruff: noqa: SLF001
 # pyright: reportPrivateUsage=false
 
-import sys
+import importlib
 from typing import Any, TypedDict
 
 from typing_extensions import NotRequired
@@ -13,10 +13,15 @@ from typing_extensions import NotRequired
 import apathetic_schema as amod_schema  # pyright: ignore[reportUnusedImport]  # noqa: F401  # Ensures module is loaded
 
 
-# Access submodule via sys.modules (runtime_swap handles the swap transparently)
-ApatheticSchema_Internal_ValidateTypedDict = sys.modules[
+# Access submodule via importlib (runtime_swap handles the swap transparently)
+ApatheticSchema_Internal_ValidateTypedDict = importlib.import_module(
     "apathetic_schema.validate_typed_dict"
-].ApatheticSchema_Internal_ValidateTypedDict
+).ApatheticSchema_Internal_ValidateTypedDict
+
+
+# Method references bound once at import so test bodies skip the
+# class-attribute lookup per call
+_infer_type_label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label
 
 
 # ---------------------------------------------------------------------------
@@ -33,11 +38,11 @@ class MiniBuild(TypedDict):
 
 def test_infer_type_label_basic_types() -> None:
     # --- execute and verify ---
-    assert "str" in ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(str)
-    assert "list" in ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
+    assert "str" in _infer_type_label(str)
+    assert "list" in _infer_type_label(
         list[str],
     )
-    assert "MiniBuild" in ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
+    assert "MiniBuild" in _infer_type_label(
         MiniBuild,
     )
 
@@ -49,15 +54,15 @@ def test_infer_type_label_handles_unusual_types() -> None:
     class Custom: ...
 
     # --- execute, verify ---
-    assert "Custom" in ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
+    assert "Custom" in _infer_type_label(
         Custom,
     )
-    assert "Any" in ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(
+    assert "Any" in _infer_type_label(
         list[Any],
     )
     # Should fall back gracefully on unknown types
     assert isinstance(
-        ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(Any),
+        _infer_type_label(Any),
         str,
     )
 
@@ -68,7 +73,7 @@ class TestNotRequiredTypeLabels:
     def test_notrequired_string_unwraps_to_str(self) -> None:
         """NotRequired[str] should unwrap to 'str' label."""
         nr = NotRequired[str]
-        label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(nr)
+        label = _infer_type_label(nr)
 
         # --- verify ---
         assert "str" in label
@@ -77,7 +82,7 @@ class TestNotRequiredTypeLabels:
     def test_notrequired_int_unwraps_to_int(self) -> None:
         """NotRequired[int] should unwrap to 'int' label."""
         nr = NotRequired[int]
-        label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(nr)
+        label = _infer_type_label(nr)
 
         # --- verify ---
         assert "int" in label
@@ -86,7 +91,7 @@ class TestNotRequiredTypeLabels:
     def test_notrequired_list_of_str(self) -> None:
         """NotRequired[list[str]] should unwrap to list[str]."""
         nr = NotRequired[list[str]]
-        label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(nr)
+        label = _infer_type_label(nr)
 
         # --- verify ---
         assert "list" in label
@@ -95,7 +100,7 @@ class TestNotRequiredTypeLabels:
     def test_notrequired_typeddict(self) -> None:
         """NotRequired[TypedDict] should unwrap to TypedDict name."""
         nr = NotRequired[MiniBuild]
-        label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(nr)
+        label = _infer_type_label(nr)
 
         # --- verify ---
         assert "MiniBuild" in label
@@ -104,7 +109,7 @@ class TestNotRequiredTypeLabels:
     def test_notrequired_union(self) -> None:
         """NotRequired[str | int] should unwrap properly."""
         nr = NotRequired[str | int]
-        label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(nr)
+        label = _infer_type_label(nr)
 
         # --- verify ---
         # Should be some representation of the union
@@ -7,16 +7,22 @@
 
 from __future__ import annotations
 
-import sys
+import importlib
+from itertools import chain
 from typing import Any, TypedDict
 
 from tests.utils import make_summary
 
 
-# Access submodule via sys.modules (runtime_swap handles the swap transparently)
-ApatheticSchema_Internal_ValidateTypedDict = sys.modules[
+# Access submodule via importlib (runtime_swap handles the swap transparently)
+ApatheticSchema_Internal_ValidateTypedDict = importlib.import_module(
     "apathetic_schema.validate_typed_dict"
-].ApatheticSchema_Internal_ValidateTypedDict
+).ApatheticSchema_Internal_ValidateTypedDict
+
+
+# Method references bound once at import so test bodies skip the
+# class-attribute lookup per call
+_validate_list_value = ApatheticSchema_Internal_ValidateTypedDict._validate_list_value
 
 
 # ---------------------------------------------------------------------------
@@ -36,7 +42,7 @@ def test_validate_list_value_rejects_nonlist() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_list_value(
+    ok = _validate_list_value(
         "ctx",
         "nums",
         "notalist",
@@ -57,7 +63,7 @@ def test_validate_list_value_rejects_wrong_element_type() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_list_value(
+    ok = _validate_list_value(
         "ctx",
         "nums",
         [1, "two", 3],
@@ -82,7 +88,7 @@ def test_validate_list_value_handles_typed_dict_elements() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_list_value(
+    ok = _validate_list_value(
         "ctx",
         "builds",
         val,
@@ -105,7 +111,7 @@ def test_validate_list_value_rejects_nested_mixed_types() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_list_value(
+    ok = _validate_list_value(
         "ctx",
         "nums",
         [[1, 2], ["a"]],
@@ -132,7 +138,7 @@ def test_validate_list_value_respects_prewarn() -> None:
     ]
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_list_value(
+    ok = _validate_list_value(
         "ctx",
         "builds",
         val,
@@ -145,7 +151,7 @@ def test_validate_list_value_respects_prewarn() -> None:
 
     # --- verify ---
     assert ok is True
-    pool = summary.errors + summary.strict_warnings + summary.warnings
+    pool = chain(summary.errors, summary.strict_warnings, summary.warnings)
     assert not any("dry_run" in m and "unknown key" in m for m in pool)
 
 
@@ -158,7 +164,7 @@ def test_validate_list_value_includes_examples_in_error() -> None:
     }
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_list_value(
+    ok = _validate_list_value(
         "in build #1",
         "include",
         42,  # wrong type - should be list[str]
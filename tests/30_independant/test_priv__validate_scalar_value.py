@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-import sys
+import importlib
 from typing import TYPE_CHECKING, Any
 
 import apathetic_utils as mod_utils
@@ -19,10 +19,17 @@ from tests.utils.constants import PATCH_STITCH_HINTS
 if TYPE_CHECKING:
     import pytest
 
-# Access submodule via sys.modules (runtime_swap handles the swap transparently)
-ApatheticSchema_Internal_ValidateTypedDict = sys.modules[
+# Access submodule via importlib (runtime_swap handles the swap transparently)
+ApatheticSchema_Internal_ValidateTypedDict = importlib.import_module(
     "apathetic_schema.validate_typed_dict"
-].ApatheticSchema_Internal_ValidateTypedDict
+).ApatheticSchema_Internal_ValidateTypedDict
+
+
+# Method references bound once at import so test bodies skip the
+# class-attribute lookup per call
+_validate_scalar_value = (
+    ApatheticSchema_Internal_ValidateTypedDict._validate_scalar_value
+)
 
 
 def test_validate_scalar_value_accepts_correct_type() -> None:
@@ -30,7 +37,7 @@ def test_validate_scalar_value_accepts_correct_type() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_scalar_value(
+    ok = _validate_scalar_value(
         "ctx",
         "x",
         42,
@@ -52,7 +59,7 @@ def test_validate_scalar_value_rejects_wrong_type() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_scalar_value(
+    ok = _validate_scalar_value(
         "ctx",
         "x",
         "abc",
@@ -86,7 +93,7 @@ def test_validate_scalar_value_handles_fallback_path(
         package_prefix=PROGRAM_PACKAGE,
         stitch_hints=PATCH_STITCH_HINTS,
     )
-    ok = ApatheticSchema_Internal_ValidateTypedDict._validate_scalar_value(
+    ok = _validate_scalar_value(
         "ctx",
         "x",
         5,
@@ -7,7 +7,8 @@
 
 from __future__ import annotations
 
-import sys
+import importlib
+from itertools import chain
 from typing import Any, TypedDict
 
 import pytest
@@ -16,12 +17,21 @@ import apathetic_schema as amod_schema
 from tests.utils import make_summary
 
 
-# Access submodule via sys.modules (runtime_swap handles the swap transparently)
+# Access submodule via importlib (runtime_swap handles the swap transparently)
 # Note: Can't use `import apathetic_schema.validate_typed_dict` because
 # __init__.py exports it as a function, not the module
-ApatheticSchema_Internal_ValidateTypedDict = sys.modules[
+ApatheticSchema_Internal_ValidateTypedDict = importlib.import_module(
     "apathetic_schema.validate_typed_dict"
-].ApatheticSchema_Internal_ValidateTypedDict
+).ApatheticSchema_Internal_ValidateTypedDict
+
+
+# Method references bound once at import so test bodies skip the
+# class-attribute lookup per call
+_get_example_for_field = (
+    ApatheticSchema_Internal_ValidateTypedDict._get_example_for_field
+)
+_infer_type_label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label
+_validate_typed_dict = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict
 
 
 # ---------------------------------------------------------------------------
@@ -41,7 +51,7 @@ def test_validate_typed_dict_rejects_non_dict() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         "root",
         "notadict",
         MiniBuild,
@@ -61,7 +71,7 @@ def test_validate_typed_dict_detects_unknown_keys() -> None:
     summary = make_summary()
 
     # --- patch and execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         "root",
         {"include": ["x"], "out": "y", "weird": 1},
         MiniBuild,
@@ -74,7 +84,7 @@ def test_validate_typed_dict_detects_unknown_keys() -> None:
     # --- verify ---
     assert ok is False
     # unknown keys appear as warnings (or strict_warnings if strict=True)
-    pool = summary.warnings + summary.strict_warnings + summary.errors
+    pool = chain(summary.warnings, summary.strict_warnings, summary.errors)
     assert any("unknown key" in m.lower() for m in pool)
 
 
@@ -84,7 +94,7 @@ def test_validate_typed_dict_allows_missing_field() -> None:
     val = {"out": "dist"}  # 'include' missing
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         "ctx",
         val,
         MiniBuild,
@@ -110,7 +120,7 @@ def test_validate_typed_dict_nested_recursion() -> None:
 
     # --- patch, execute and verify ---
     summary1 = amod_schema.ApatheticSchema_ValidationSummary(True, [], [], [], True)
-    assert ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    assert _validate_typed_dict(
         "root",
         good,
         Outer,
@@ -121,7 +131,7 @@ def test_validate_typed_dict_nested_recursion() -> None:
     )
 
     summary2 = amod_schema.ApatheticSchema_ValidationSummary(True, [], [], [], True)
-    assert not ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    assert not _validate_typed_dict(
         "root",
         bad,
         Outer,
@@ -141,7 +151,7 @@ def test_validate_typed_dict_respects_prewarn() -> None:
     summary = make_summary()
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         "ctx",
         cfg,
         MiniBuild,
@@ -153,7 +163,7 @@ def test_validate_typed_dict_respects_prewarn() -> None:
 
     # --- verify ---
     assert ok is True
-    pool = summary.errors + summary.strict_warnings + summary.warnings
+    pool = chain(summary.errors, summary.strict_warnings, summary.warnings)
     assert not any("dry_run" in m and "unknown key" in m for m in pool)
 
 
@@ -164,6 +174,10 @@ def test_validate_typed_dict_respects_prewarn() -> None:
         ("root.unmatched_field", {"root.other_*": "value"}, None),
         ("root.include", {"root.include": '["src"]', "root.out": '"dist"'}, '["src"]'),
         ("root.out", {"root.include": '["src"]', "root.out": '"dist"'}, '"dist"'),
+        # First-match-wins must hold across '**' and '*' patterns in
+        # either mapping order, not just within each kind
+        ("root.x", {"root.**": "AA", "root.*": "BB"}, "AA"),
+        ("root.x", {"root.*": "BB", "root.**": "AA"}, "BB"),
     ],
 )
 def test_validate_typed_dict_field_examples_matching(
@@ -173,7 +187,7 @@ def test_validate_typed_dict_field_examples_matching(
 ) -> None:
     """Field examples should support exact path and wildcard pattern matching."""
     # --- execute ---
-    example = ApatheticSchema_Internal_ValidateTypedDict._get_example_for_field(  # pyright: ignore[reportPrivateUsage]
+    example = _get_example_for_field(  # pyright: ignore[reportPrivateUsage]
         field_path,
         field_examples,
     )
@@ -197,7 +211,7 @@ def test_validate_typed_dict_infer_type_label_exception() -> None:
 
     # --- execute ---
     # Should not raise, should return string representation
-    label = ApatheticSchema_Internal_ValidateTypedDict._infer_type_label(  # pyright: ignore[reportPrivateUsage]
+    label = _infer_type_label(  # pyright: ignore[reportPrivateUsage]
         problematic,
     )
 
@@ -218,7 +232,7 @@ def test_validate_typed_dict_example_message_formatting() -> None:
     summary = make_summary()
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         context="root",
         val={"interval": "not_an_int"},  # Wrong type
         typedict_cls=Config,
@@ -247,7 +261,7 @@ def test_validate_typed_dict_unknown_keys_with_hints() -> None:
     summary = make_summary()
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         context="root",
         val={"include": ["src"], "outpt": "dist"},  # "outpt" is close to "output"
         typedict_cls=Config,
@@ -261,7 +275,7 @@ def test_validate_typed_dict_unknown_keys_with_hints() -> None:
     assert ok is False
     # Note: get_close_matches might not always find a match depending on cutoff
     # So we just check that unknown key error is present
-    pool = summary.warnings + summary.strict_warnings + summary.errors
+    pool = chain(summary.warnings, summary.strict_warnings, summary.errors)
     assert any("unknown key" in m.lower() or "outpt" in m.lower() for m in pool)
 
 
@@ -275,7 +289,7 @@ def test_validate_typed_dict_unknown_keys_location_handling() -> None:
     summary = make_summary()
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         context="in top-level configuration.",
         val={"valid": "ok", "unknown": "bad"},
         typedict_cls=Config,
@@ -288,7 +302,7 @@ def test_validate_typed_dict_unknown_keys_location_handling() -> None:
     # --- verify ---
     assert ok is False
     # Location should be processed correctly
-    pool = summary.warnings + summary.strict_warnings + summary.errors
+    pool = chain(summary.warnings, summary.strict_warnings, summary.errors)
     # Should mention unknown key
     assert any("unknown" in m.lower() for m in pool)
 
@@ -309,7 +323,7 @@ def test_validate_typed_dict_nested_location_handling() -> None:
     summary = make_summary()
 
     # --- execute ---
-    ok = ApatheticSchema_Internal_ValidateTypedDict.validate_typed_dict(
+    ok = _validate_typed_dict(
         context="in top-level configuration.",
         val={"inner": {"value": "ok"}},
         typedict_cls=_TestNestedLocation_Outer,
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from itertools import chain
 from typing import Any, TypedDict
 
 import apathetic_schema as amod_schema
@@ -21,6 +22,12 @@ class MiniBuild(TypedDict):
     out: str
 
 
+# Module scope so the self-referencing forward ref can resolve
+class Node(TypedDict):
+    name: str
+    child: Node
+
+
 def test_validate_typed_dict_accepts_valid_dict() -> None:
     """Valid dict should pass validation."""
     # --- execute ---
@@ -76,7 +83,7 @@ def test_validate_typed_dict_detects_unknown_keys() -> None:
     # --- verify ---
     assert ok is False
     # unknown keys appear as warnings (or strict_warnings if strict=True)
-    pool = summary.warnings + summary.strict_warnings + summary.errors
+    pool = chain(summary.warnings, summary.strict_warnings, summary.errors)
     assert any("unknown key" in m.lower() for m in pool)
 
 
@@ -136,6 +143,29 @@ def test_validate_typed_dict_nested_recursion() -> None:
     assert summary2.errors
 
 
+def test_validate_typed_dict_handles_cyclic_input() -> None:
+    """Self-referencing config dicts should validate once, not recurse forever."""
+    # --- setup ---
+    node: dict[str, Any] = {"name": "root"}
+    node["child"] = node  # cycle back to itself
+    summary = make_summary()
+
+    # --- execute ---
+    ok = amod_schema.validate_typed_dict(
+        "root",
+        node,
+        Node,
+        strict=True,
+        summary=summary,
+        prewarn=set(),
+        field_path="root",
+    )
+
+    # --- verify ---
+    assert ok is True
+    assert summary.errors == []
+
+
 def test_validate_typed_dict_respects_prewarn() -> None:
     """Keys in prewarn set should be skipped and not trigger unknown-key messages."""
     # --- setup ---
@@ -156,5 +186,5 @@ def test_validate_typed_dict_respects_prewarn() -> None:
 
     # --- verify ---
     assert ok is True
-    pool = summary.errors + summary.strict_warnings + summary.warnings
+    pool = chain(summary.errors, summary.strict_warnings, summary.warnings)
     assert not any("dry_run" in m and "unknown key" in m for m in pool)
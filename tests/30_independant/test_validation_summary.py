@@ -0,0 +1,57 @@
+# tests/0_independant/test_validation_summary.py
+"""Tests for ApatheticSchema_ValidationSummary helpers."""
+
+from __future__ import annotations
+
+import apathetic_schema as amod_schema
+from tests.utils import make_summary
+
+
+def test_validation_summary_reset_clears_buckets() -> None:
+    # --- setup ---
+    summary = make_summary(strict=True)
+    summary.valid = False
+    summary.errors.append("boom")
+    summary.strict_warnings.append("strict boom")
+    summary.warnings.append("soft boom")
+    errors_ref = summary.errors
+
+    # --- execute ---
+    summary.reset()
+
+    # --- verify ---
+    assert summary.valid is True
+    assert summary.errors == []
+    assert summary.strict_warnings == []
+    assert summary.warnings == []
+    # strictness survives, and the buckets are cleared in place
+    assert summary.strict is True
+    assert summary.errors is errors_ref
+
+
+def test_validation_summary_reset_allows_reuse() -> None:
+    # --- setup ---
+    summary = make_summary(strict=True)
+    schema: dict[str, type] = {"foo": str}
+
+    # --- execute ---
+    first = amod_schema.check_schema_conformance(
+        {"foo": 123},
+        schema,
+        "ctx",
+        strict_config=True,
+        summary=summary,
+    )
+    summary.reset()
+    second = amod_schema.check_schema_conformance(
+        {"foo": "ok"},
+        schema,
+        "ctx",
+        strict_config=True,
+        summary=summary,
+    )
+
+    # --- verify ---
+    assert first is False
+    assert second is True
+    assert summary.errors == []
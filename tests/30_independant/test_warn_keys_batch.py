@@ -0,0 +1,154 @@
+# tests/0_independant/test_warn_keys_batch.py
+"""Tests for warn_keys_batch function."""
+
+from __future__ import annotations
+
+import apathetic_schema as amod_schema
+
+
+# Get the namespace class
+apathetic_schema = amod_schema.apathetic_schema
+
+
+def test_warn_keys_batch_matches_per_rule_results(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
+    """Batch results should match what warn_keys_once reports per rule."""
+    # --- setup ---
+    summary = summary_nonstrict
+    cfg = {"dry_run": True, "DEPRECATED": "value", "valid": "ok"}
+    rules = [
+        ("dry-run", {"dry_run"}, "Found {keys} {ctx}"),
+        ("deprecated", {"deprecated"}, "Found {keys} {ctx}"),
+        ("root-only", {"root_only"}, "Found {keys} {ctx}"),
+    ]
+
+    # --- execute ---
+    valid, found_by_tag = apathetic_schema.warn_keys_batch(
+        rules,
+        cfg,
+        "in config",
+        strict_config=False,
+        summary=summary,
+        agg=None,
+    )
+
+    # --- verify ---
+    assert valid is True
+    assert found_by_tag["dry-run"] == {"dry_run"}
+    # Case-insensitive fallback preserves the original case from cfg
+    assert found_by_tag["deprecated"] == {"DEPRECATED"}
+    assert found_by_tag["root-only"] == set()
+    expected_warning_count = 2
+    assert len(summary.warnings) == expected_warning_count
+
+
+def test_warn_keys_batch_strict_invalidates_on_any_hit(
+    summary_strict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
+    """A single matching rule should flip valid to False under strict."""
+    # --- setup ---
+    summary = summary_strict
+    cfg = {"dry_run": True}
+    rules = [
+        ("clean", {"unrelated"}, "Found {keys} {ctx}"),
+        ("dry-run", {"dry_run"}, "Found {keys} {ctx}"),
+    ]
+
+    # --- execute ---
+    valid, found_by_tag = apathetic_schema.warn_keys_batch(
+        rules,
+        cfg,
+        "in config",
+        strict_config=True,
+        summary=summary,
+        agg=None,
+    )
+
+    # --- verify ---
+    assert valid is False
+    assert found_by_tag["clean"] == set()
+    assert found_by_tag["dry-run"] == {"dry_run"}
+    assert len(summary.strict_warnings) == 1
+
+
+def test_warn_keys_batch_aggregates_under_tags(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
+    """With an aggregator, each matching rule gets its own tagged entry."""
+    # --- setup ---
+    summary = summary_nonstrict
+    agg: amod_schema.ApatheticSchema_SchemaErrorAggregator = {}
+    cfg = {"dry_run": True, "deprecated": "value"}
+    rules = [
+        ("dry-run", {"dry_run"}, "Message {ctx}"),
+        ("deprecated", {"deprecated"}, "Message {ctx}"),
+    ]
+
+    # --- execute ---
+    valid, _found_by_tag = apathetic_schema.warn_keys_batch(
+        rules,
+        cfg,
+        "in config",
+        strict_config=False,
+        summary=summary,
+        agg=agg,
+    )
+
+    # --- verify ---
+    assert valid is True
+    assert "dry-run" in agg["warnings"]
+    assert "deprecated" in agg["warnings"]
+    # Summary is untouched when the aggregator collects the warnings
+    assert summary.warnings == []
+
+
+def test_warn_keys_batch_mixed_exact_and_case_variant_hits(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
+    """One rule hitting both exactly and case-variantly reports both."""
+    # --- setup ---
+    summary = summary_nonstrict
+    # dry_run matches exactly; deprecated only matches case-insensitively
+    cfg = {"dry_run": True, "DEPRECATED": "value", "valid": "ok"}
+    rules = [("bad-keys", {"dry_run", "deprecated"}, "Found {keys} {ctx}")]
+
+    # --- execute ---
+    _valid, found_by_tag = apathetic_schema.warn_keys_batch(
+        rules,
+        cfg,
+        "in config",
+        strict_config=False,
+        summary=summary,
+        agg=None,
+    )
+
+    # --- verify ---
+    # Both hits are reported, with original case preserved from cfg
+    assert found_by_tag["bad-keys"] == {"dry_run", "DEPRECATED"}
+    assert len(summary.warnings) == 1
+
+
+def test_warn_keys_batch_empty_cfg_short_circuits(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
+    """An empty cfg should report every rule clean without any warnings."""
+    # --- setup ---
+    summary = summary_nonstrict
+    rules = [("dry-run", {"dry_run"}, "Found {keys} {ctx}")]
+
+    # --- execute ---
+    valid, found_by_tag = apathetic_schema.warn_keys_batch(
+        rules,
+        {},
+        "in config",
+        strict_config=True,
+        summary=summary,
+        agg=None,
+    )
+
+    # --- verify ---
+    assert valid is True
+    assert found_by_tag == {"dry-run": set()}
+    assert not summary.warnings
+    assert not summary.strict_warnings
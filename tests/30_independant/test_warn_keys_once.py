@@ -15,10 +15,12 @@ from tests.utils import make_summary
 apathetic_schema = amod_schema.apathetic_schema
 
 
-def test_warn_keys_once_no_bad_keys() -> None:
+def test_warn_keys_once_no_bad_keys(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     """When no bad keys are found, should return valid=True and empty set."""
     # --- setup ---
-    summary = make_summary()
+    summary = summary_nonstrict
     cfg = {"valid_key": "value", "another": 123}
     bad_keys = {"bad_key", "deprecated"}
 
@@ -99,16 +101,19 @@ def test_warn_keys_once_with_aggregator(
         agg[expected_agg_key]["dry-run"],
     )
     assert entry["msg"] == msg
-    assert context in entry["contexts"]
+    # Contexts are normalized at insert time (leading 'in '/'on ' removed)
+    assert context.removeprefix("in ") in entry["contexts"]
     # Summary should not be modified when using aggregator
     assert summary.warnings == expected_summary_warnings
     assert summary.strict_warnings == expected_summary_strict_warnings
 
 
-def test_warn_keys_once_with_aggregator_multiple_contexts() -> None:
+def test_warn_keys_once_with_aggregator_multiple_contexts(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     """Aggregator should collect multiple contexts for the same tag."""
     # --- setup ---
-    summary = make_summary()
+    summary = summary_nonstrict
     agg: amod_schema.ApatheticSchema_SchemaErrorAggregator = {}
     bad_keys = {"dry_run"}
 
@@ -205,10 +210,12 @@ def test_warn_keys_once_without_aggregator(
     assert not summary.errors
 
 
-def test_warn_keys_once_case_insensitive_matching() -> None:
+def test_warn_keys_once_case_insensitive_matching(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     """Should match keys case-insensitively but preserve original case."""
     # --- setup ---
-    summary = make_summary()
+    summary = summary_nonstrict
     # Test that lowercase bad_key matches uppercase cfg key
     cfg = {"DRY_RUN": True, "valid": "value"}
     bad_keys = {"dry_run"}  # Lowercase
@@ -233,10 +240,43 @@ def test_warn_keys_once_case_insensitive_matching() -> None:
     assert "DRY_RUN" in msg  # Original case should appear in message
 
 
-def test_warn_keys_once_multiple_bad_keys() -> None:
+def test_warn_keys_once_mixed_exact_and_case_variant_hits(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
+    """An exact hit must not mask case-variant hits of other bad keys."""
+    # --- setup ---
+    summary = summary_nonstrict
+    # dry_run matches exactly; deprecated only matches case-insensitively
+    cfg = {"dry_run": True, "DEPRECATED": "value", "valid": "ok"}
+    bad_keys = {"dry_run", "deprecated"}
+
+    # --- execute ---
+    _valid, found = apathetic_schema.warn_keys_once(
+        tag="test",
+        bad_keys=bad_keys,
+        cfg=cfg,
+        context="test",
+        msg="Found {keys} {ctx}",
+        strict_config=False,
+        summary=summary,
+        agg=None,
+    )
+
+    # --- verify ---
+    # Both hits are reported, with original case preserved from cfg
+    assert found == {"dry_run", "DEPRECATED"}
+    assert len(summary.warnings) == 1
+    msg = summary.warnings[0]
+    assert "dry_run" in msg
+    assert "DEPRECATED" in msg
+
+
+def test_warn_keys_once_multiple_bad_keys(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     """Should find and report multiple bad keys."""
     # --- setup ---
-    summary = make_summary()
+    summary = summary_nonstrict
     cfg = {"dry_run": True, "deprecated": "value", "valid": "ok"}
     bad_keys = {"dry_run", "deprecated"}
 
@@ -260,10 +300,12 @@ def test_warn_keys_once_multiple_bad_keys() -> None:
     assert "dry_run" in msg or "deprecated" in msg
 
 
-def test_warn_keys_once_message_formatting() -> None:
+def test_warn_keys_once_message_formatting(
+    summary_nonstrict: amod_schema.ApatheticSchema_ValidationSummary,
+) -> None:
     """Message should be formatted with keys and context placeholders."""
     # --- setup ---
-    summary = make_summary()
+    summary = summary_nonstrict
     cfg = {"bad": True}
     bad_keys = {"bad"}
 
@@ -0,0 +1,133 @@
+# tests/90_integration/test_lazy_import_semantics.py
+"""Integration tests pinning the lazy-import behavior of the package.
+
+``apathetic_schema/__init__.py`` defers all submodule imports behind a
+module-level ``__getattr__`` (PEP 562). These tests guard that contract so
+future contributors don't accidentally re-introduce eager imports:
+
+- A plain ``import apathetic_schema`` must not load any of the validator
+  submodules into ``sys.modules``
+- Accessing an exported name must resolve it (and cache it for later access)
+
+The checks run in a subprocess so they observe a genuinely cold import,
+unaffected by whatever this test session has already loaded. They only make
+sense in package mode — stitched and zipapp builds execute everything in a
+single module by design.
+"""
+
+# Runtime mode: only run in package mode
+__runtime_mode__ = "package"
+
+import subprocess
+import sys
+import textwrap
+
+from tests.utils.constants import PROGRAM_PACKAGE, PROJ_ROOT
+
+
+#: Submodules that must stay unloaded after a bare package import
+_LAZY_SUBMODULES = [
+    "check_schema_conformance",
+    "collect_msg",
+    "flush_schema_aggregators",
+    "namespace",
+    "validate_typed_dict",
+    "warn_keys_once",
+]
+
+
+def _run_in_subprocess(
+    code: str,
+    extra_env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a snippet against src/ in a fresh interpreter."""
+    env = {"PYTHONPATH": str(PROJ_ROOT / "src")}
+    if extra_env:
+        env.update(extra_env)
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=PROJ_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_bare_import_loads_no_submodules() -> None:
+    """A plain ``import apathetic_schema`` must not pull in submodules."""
+    # --- setup ---
+    submodules = ", ".join(f"'{PROGRAM_PACKAGE}.{m}'" for m in _LAZY_SUBMODULES)
+    code = f"""
+        import sys
+        import {PROGRAM_PACKAGE}
+
+        loaded = [
+            name for name in ({submodules},)
+            if name in sys.modules
+        ]
+        assert not loaded, f"eagerly imported: {{loaded}}"
+    """
+
+    # --- execute ---
+    result = _run_in_subprocess(code)
+
+    # --- verify ---
+    assert result.returncode == 0, (
+        f"Eager submodule import detected.\n"
+        f"stdout: {result.stdout}\n"
+        f"stderr: {result.stderr}"
+    )
+
+
+def test_lazy_exports_resolve_on_first_access() -> None:
+    """Every ``__all__`` entry must resolve through the lazy gate."""
+    # --- setup ---
+    code = f"""
+        import {PROGRAM_PACKAGE} as pkg
+
+        for name in pkg.__all__:
+            obj = getattr(pkg, name)
+            assert obj is not None, name
+            # Second access must hit the cached binding, not a module
+            # attribute left behind by the submodule import machinery
+            assert getattr(pkg, name) is obj, name
+
+        # Function aliases must be callables, not shadowing submodules
+        assert callable(pkg.warn_keys_once)
+        assert callable(pkg.check_schema_conformance)
+    """
+
+    # --- execute ---
+    result = _run_in_subprocess(code)
+
+    # --- verify ---
+    assert result.returncode == 0, (
+        f"Lazy export failed to resolve.\n"
+        f"stdout: {result.stdout}\n"
+        f"stderr: {result.stderr}"
+    )
+
+
+def test_eager_import_knob_resolves_all_exports() -> None:
+    """APATHETIC_SCHEMA_EAGER_IMPORT=1 must materialize every lazy export."""
+    # --- setup ---
+    code = f"""
+        import {PROGRAM_PACKAGE} as pkg
+
+        # With the eager knob set, every export is already a real module
+        # global, so __getattr__ must not be consulted again
+        for name in pkg.__all__:
+            assert name in vars(pkg), name
+    """
+
+    # --- execute ---
+    result = _run_in_subprocess(
+        code,
+        extra_env={"APATHETIC_SCHEMA_EAGER_IMPORT": "1"},
+    )
+
+    # --- verify ---
+    assert result.returncode == 0, (
+        f"Eager import knob failed.\nstdout: {result.stdout}\nstderr: {result.stderr}"
+    )
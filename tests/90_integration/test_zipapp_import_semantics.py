@@ -17,21 +17,22 @@ when built with zipbundler (not testing the tool itself).
 __runtime_mode__ = "zipapp"
 
 import importlib
-import subprocess
 import sys
-import zipfile
 from pathlib import Path
 
 import pytest
 
-from tests.utils.constants import PROGRAM_PACKAGE, PROGRAM_SCRIPT, PROJ_ROOT
+from tests.utils.constants import PROGRAM_PACKAGE
 
 
-def test_zipapp_import_semantics(tmp_path: Path) -> None:
+# Distinct xdist group from the serger build test so the two subprocess
+# builds land on separate workers under -n auto --dist loadgroup
+@pytest.mark.xdist_group("zipapp_build")
+def test_zipapp_import_semantics(zipapp_built_pyz: Path) -> None:
     """Test that zipapp builds maintain correct import semantics.
 
     This test verifies our project code works correctly when built with zipbundler:
-    1. Builds apathetic_utils as a zipapp using zipbundler (from project root)
+    1. Uses the session-scoped zipbundler build (built once per session)
     2. Imports from the zipapp and verifies import semantics work correctly:
        - Can import and use the module from zipapp format
        - Exported constants and classes are accessible
@@ -39,38 +40,17 @@ def test_zipapp_import_semantics(tmp_path: Path) -> None:
     This verifies our project configuration and code work correctly with zipbundler.
     """
     # --- setup ---
-    # Use pytest's tmp_path to avoid race conditions in parallel test execution
-    test_id = id(test_zipapp_import_semantics)
-    zipapp_file = tmp_path / f"{PROGRAM_SCRIPT}_{test_id}.pyz"
-
-    # --- execute: build zipapp ---
-    zipapp_cmd = [sys.executable, "-m", "zipbundler"]
-    result = subprocess.run(  # noqa: S603
-        [
-            *zipapp_cmd,
-            "-c",
-            "-o",
-            str(zipapp_file),
-            "src",
-        ],
-        cwd=PROJ_ROOT,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        pytest.fail(
-            f"Zipbundler failed with return code {result.returncode}.\n"
-            f"stdout: {result.stdout}\n"
-            f"stderr: {result.stderr}",
-        )
-
-    if not zipapp_file.exists():
-        pytest.fail(f"Zipapp file not created at {zipapp_file}")
+    # The build itself is handled by the session-scoped fixture so other
+    # integration tests can share the same artifact
+    zipapp_file = zipapp_built_pyz
 
     # Verify it's a valid zip file
-    assert zipfile.is_zipfile(zipapp_file), "Zipapp should be a valid zip file"
+    # A bounded header sniff beats zipfile.is_zipfile, which seeks to the
+    # end of the file to locate the central directory; the local-file
+    # magic may sit after a shebang line, so scan the first KiB for it
+    with zipapp_file.open("rb") as zf:
+        head = zf.read(1024)
+    assert b"PK\x03\x04" in head, "Zipapp should be a valid zip file"
 
     # --- execute: import from zipapp ---
     # Add zipapp to sys.path and import
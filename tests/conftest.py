@@ -33,15 +33,27 @@ alib_utils.runtime_swap(
 )
 
 from tests.utils import (  # noqa: E402
+    _summary_template_nonstrict,
+    _summary_template_strict,
     direct_logger,
     module_logger,
+    serger_built_script,
+    summary_nonstrict,
+    summary_strict,
+    zipapp_built_pyz,
 )
 
 
 # These fixtures are intentionally re-exported so pytest can discover them.
 __all__ = [
+    "_summary_template_nonstrict",
+    "_summary_template_strict",
     "direct_logger",
     "module_logger",
+    "serger_built_script",
+    "summary_nonstrict",
+    "summary_strict",
+    "zipapp_built_pyz",
 ]
 
 safe_trace = alib_logging.makeSafeTrace("⚡️")
@@ -1,6 +1,16 @@
 # tests/utils/__init__.py
 
-from .config_validate import make_summary
+from .build_artifacts import (
+    serger_built_script,
+    zipapp_built_pyz,
+)
+from .config_validate import (
+    _summary_template_nonstrict,
+    _summary_template_strict,
+    make_summary,
+    summary_nonstrict,
+    summary_strict,
+)
 from .constants import (
     BUNDLER_SCRIPT,
     DEFAULT_TEST_LOG_LEVEL,
@@ -32,4 +42,10 @@ __all__ = [  # noqa: RUF022
     # fixtures
     "direct_logger",
     "module_logger",
+    "serger_built_script",
+    "summary_nonstrict",
+    "summary_strict",
+    "zipapp_built_pyz",
+    "_summary_template_nonstrict",
+    "_summary_template_strict",
 ]
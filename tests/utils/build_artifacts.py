@@ -0,0 +1,151 @@
+# tests/utils/build_artifacts.py
+"""Session-scoped build-artifact fixtures for integration tests.
+
+Shelling out to serger or zipbundler dominates integration-test wall
+time, and every test that exercises a built artifact used to run its
+own build. These fixtures build each artifact at most once per session
+and hand every consuming test the same path; a content digest of the
+``src/`` tree and serger config, recorded in a sidecar file next to
+each artifact, guards against reusing an artifact that predates a
+source edit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import py_compile
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from .constants import PROGRAM_SCRIPT, PROJ_ROOT
+
+
+# Skip the /proc/self/fd walk that close_fds=True performs on POSIX: the
+# bundlers don't rely on any inherited descriptors, and a pytest worker
+# (log capture, coverage, xdist sockets) can hold a lot of them.
+# Windows keeps the default (True), where handle inheritance differs.
+_CLOSE_FDS: bool = sys.platform == "win32"
+
+
+def _src_tree_digest() -> str:
+    """Hash every ``src/`` Python file, in sorted order, into one digest.
+
+    Content hashing survives mtime churn (e.g. from git checkouts) that
+    would force a rebuild under a timestamp comparison, so a still-valid
+    artifact keeps getting reused. The serger config participates in the
+    digest too, since config edits change the stitched output just as
+    surely as source edits do.
+    """
+    digest = hashlib.sha256()
+    for src in sorted((PROJ_ROOT / "src").rglob("*.py")):
+        digest.update(src.read_bytes())
+    config_file = PROJ_ROOT / ".serger.jsonc"
+    if config_file.exists():
+        digest.update(config_file.read_bytes())
+    return digest.hexdigest()
+
+
+def _artifact_is_current(output_file: Path, digest: str) -> bool:
+    """Check ``output_file`` against its recorded source-tree digest."""
+    # Append rather than swap the suffix so the .py and .pyz
+    # artifacts keep distinct sidecars
+    sidecar = Path(str(output_file) + ".sha256")
+    return (
+        output_file.exists()
+        and sidecar.exists()
+        and sidecar.read_text(encoding="utf-8") == digest
+    )
+
+
+def _run_build(cmd: list[str], output_file: Path, tool: str) -> None:
+    """Run a build command and fail the session loudly if it breaks.
+
+    Build output is redirected to kernel-backed temp files instead of
+    captured pipes: the text is only consulted on failure, so the
+    success path never drains or copies it into the Python heap.
+    """
+    with (
+        tempfile.TemporaryFile("w+") as out,
+        tempfile.TemporaryFile("w+") as err,
+    ):
+        result = subprocess.run(  # noqa: S603
+            cmd,
+            cwd=PROJ_ROOT,
+            stdout=out,
+            stderr=err,
+            check=False,
+            close_fds=_CLOSE_FDS,
+        )
+
+        if result.returncode != 0:
+            out.seek(0)
+            err.seek(0)
+            pytest.fail(
+                f"{tool} failed with return code {result.returncode}.\n"
+                f"stdout: {out.read()}\n"
+                f"stderr: {err.read()}",
+            )
+
+    if not output_file.exists():
+        pytest.fail(f"{tool} did not create {output_file}")
+
+
+@pytest.fixture(scope="session")
+def serger_built_script(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the project once with serger and share the stitched file.
+
+    A sibling ``<output>.pyc`` bytecode cache is compiled alongside the
+    stitched script so consuming tests can exec the code object without
+    reparsing the (large) source on every use.
+    """
+    output_file = tmp_path_factory.getbasetemp() / f"{PROGRAM_SCRIPT}_session.py"
+    digest = _src_tree_digest()
+    if not _artifact_is_current(output_file, digest):
+        config_file = PROJ_ROOT / ".serger.jsonc"
+        _run_build(
+            [
+                sys.executable,
+                "-m",
+                "serger.__main__",
+                "--config",
+                str(config_file),
+                "--out",
+                str(output_file),
+            ],
+            output_file,
+            "Serger",
+        )
+        py_compile.compile(
+            str(output_file),
+            cfile=str(output_file) + "c",
+            doraise=True,
+        )
+        Path(str(output_file) + ".sha256").write_text(digest, encoding="utf-8")
+    return output_file
+
+
+@pytest.fixture(scope="session")
+def zipapp_built_pyz(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the project once with zipbundler and share the .pyz file."""
+    output_file = tmp_path_factory.getbasetemp() / f"{PROGRAM_SCRIPT}_session.pyz"
+    digest = _src_tree_digest()
+    if not _artifact_is_current(output_file, digest):
+        _run_build(
+            [
+                sys.executable,
+                "-m",
+                "zipbundler",
+                "-c",
+                "-o",
+                str(output_file),
+                "src",
+            ],
+            output_file,
+            "Zipbundler",
+        )
+        Path(str(output_file) + ".sha256").write_text(digest, encoding="utf-8")
+    return output_file
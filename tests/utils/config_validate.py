@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+
+import pytest
+
 import apathetic_schema
 
 
@@ -21,3 +25,46 @@ def make_summary(
         warnings=warnings or [],
         strict=strict,
     )
+
+
+def _copy_summary(
+    template: apathetic_schema.ApatheticSchema_ValidationSummary,
+) -> apathetic_schema.ApatheticSchema_ValidationSummary:
+    """Clone a session template with fresh message buckets per test."""
+    summary = copy.copy(template)
+    summary.valid = True
+    summary.errors = []
+    summary.strict_warnings = []
+    summary.warnings = []
+    return summary
+
+
+# Session-scope templates: the summary shape is built once per run and
+# each test receives a shallow copy with fresh list buckets, instead of
+# reconstructing the object from scratch in every test body.
+
+
+@pytest.fixture(scope="session")
+def _summary_template_strict() -> apathetic_schema.ApatheticSchema_ValidationSummary:
+    return make_summary(strict=True)
+
+
+@pytest.fixture(scope="session")
+def _summary_template_nonstrict() -> apathetic_schema.ApatheticSchema_ValidationSummary:
+    return make_summary(strict=False)
+
+
+@pytest.fixture
+def summary_strict(
+    _summary_template_strict: apathetic_schema.ApatheticSchema_ValidationSummary,
+) -> apathetic_schema.ApatheticSchema_ValidationSummary:
+    """Fresh strict ValidationSummary cloned from the session template."""
+    return _copy_summary(_summary_template_strict)
+
+
+@pytest.fixture
+def summary_nonstrict(
+    _summary_template_nonstrict: apathetic_schema.ApatheticSchema_ValidationSummary,
+) -> apathetic_schema.ApatheticSchema_ValidationSummary:
+    """Fresh non-strict ValidationSummary cloned from the session template."""
+    return _copy_summary(_summary_template_nonstrict)
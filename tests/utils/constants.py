@@ -5,7 +5,10 @@ from pathlib import Path
 
 
 #: Project root directory (tests/utils/constants.py -> project root)
-PROJ_ROOT = Path(__file__).resolve().parent.parent.parent.resolve()
+#: parents[2] indexes the already-resolved path directly, avoiding the
+#: intermediate Path objects and second realpath the chained
+#: .parent.parent.parent.resolve() spelling paid on every test import
+PROJ_ROOT = Path(__file__).resolve().parents[2]
 
 #: Package name used for imports and module paths
 PROGRAM_PACKAGE = "apathetic_schema"